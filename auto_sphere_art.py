@@ -4,12 +4,26 @@ Spheres appear one by one from center and move to form the image pattern.
 """
 
 import pygame
-import math
-import random
+import argparse
 import sys
 import os
 import numpy as np
-from PIL import Image
+from sphere_store import SphereStore, SphereField, color_tuple
+from sprite_cache import SpriteCache, default_cache, EFFECT_DISC, EFFECT_SPHERE, EFFECT_SPHERE_GLOW
+from static_layer import StaticLayer
+from dirty_rects import DirtyRectRenderer
+from offline_render import add_export_arguments, is_export, prepare_export, export_frames, output_size
+from parallel_export import add_parallel_arguments, export_parallel
+from frame_profiler import FrameProfiler, add_profiler_arguments
+from layout_cache import LayoutCache
+from dot_queue import DotQueue
+from sim_clock import SimClock
+from quality_governor import QualityGovernor
+from timeline import Timeline, Playhead
+from image_loader import load_fitted
+from adaptive_sampling import quadtree_cells
+from poisson_disk import poisson_disk_samples
+from viewport import Viewport
 
 # ==================== IMAGE CONFIGURATION ====================
 # Change this to use different images from assets/images/
@@ -23,7 +37,13 @@ pygame.init()
 # Set reasonable window dimensions  
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60  # Render frame cap; 0 renders uncapped
+SIM_RATE = 60  # Fixed simulation steps per second - the speeds below are per step
+ADAPTIVE_QUALITY = True  # Drop glow and small outlines when frames run over budget
+FRAME_BUDGET_MS = 1000 / 60
+DIRTY_RECTS = False  # Repaint and present only changed regions (for low-power displays)
+LAYOUT_CACHE = True  # Reuse computed layouts from .layout_cache/ across launches
+LAYOUT_SEED = 0  # Jitter seed; None re-jitters on every load (and skips the cache)
 
 # Sphere configuration constants - Optimized for detailed logo reproduction
 SPHERE_SPACING = 8   # Much finer sampling for precise detail capture
@@ -32,232 +52,318 @@ MAX_SPHERE_RADIUS = 12  # Smaller maximum for consistent detail level
 SPHERE_GROWTH_SPEED = 2.0  # Moderate growth for smooth animation
 SPHERE_MOVE_SPEED = 0.12   # Faster movement for quicker formation
 CREATION_DELAY = 1  # Very fast creation - 1 frame delay for maximum density
+SPHERES_PER_STEP = 1  # Spheres spawned each time the creation delay elapses
+ALPHA_CUTOFF = 32  # Pixels less opaque than this are background (resizing smears transparent edges)
+
+# Sphere placement - "grid" samples every SPHERE_SPACING pixels, "adaptive"
+# subdivides the image by detail: large spheres on flat areas, small on edges,
+# "poisson" scatters blue noise spaced by the local sphere radius
+SAMPLING_MODE = "grid"
+ADAPTIVE_MIN_CELL = 8   # Smallest quadtree cell, in pixels
+ADAPTIVE_MAX_CELL = 64  # Largest cell - ADAPTIVE_MIN_CELL times a power of two
+ADAPTIVE_COLOR_STD = 10  # Cells whose colors deviate more than this are split
+ADAPTIVE_EDGE_STRENGTH = 6  # ...and so are cells with more mean luminance change per pixel
+ADAPTIVE_RADIUS_SCALE = 0.7  # Sphere radius as a share of its cell size
+POISSON_OVERLAP = 0.6  # Poisson spheres keep this share of their radius sum apart
 
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 
 class Sphere:
-    def __init__(self, target_x, target_y, radius, color):
-        self.target_x = target_x  # Final destination position
-        self.target_y = target_y
-        self.x = SCREEN_WIDTH // 2  # Start from center
-        self.y = SCREEN_HEIGHT // 2
-        self.target_radius = radius
-        self.radius = 0  # Start with 0 radius (invisible)
-        self.color = color
-        self.velocity_x = 0  # Will be calculated to reach target
-        self.velocity_y = 0
-        self.is_growing = True
-        self.growth_speed = SPHERE_GROWTH_SPEED  # Use configurable constant
-        self.spawn_delay = 0  # Delay before starting to grow
-        self.is_moving_to_target = False
-        self.move_speed = SPHERE_MOVE_SPEED  # Use configurable constant
+    """Thin view onto one sphere's row in a SphereStore"""
+    x = SphereField('x')
+    y = SphereField('y')
+    target_x = SphereField('target_x')  # Final destination position
+    target_y = SphereField('target_y')
+    radius = SphereField('radius')
+    target_radius = SphereField('target_radius')
+    color = SphereField('color', color_tuple)
+    velocity_x = SphereField('velocity_x')
+    velocity_y = SphereField('velocity_y')
+    is_growing = SphereField('is_growing', bool)
+    growth_speed = SphereField('growth_speed')
+    spawn_delay = SphereField('spawn_delay', int)  # Delay before starting to grow
+    is_moving_to_target = SphereField('is_moving_to_target', bool)
+    move_speed = SphereField('move_speed')
+    
+    def __init__(self, target_x, target_y, radius, color, store=None):
+        # Standalone spheres get a private single-row store
+        self.store = store if store is not None else SphereStore(capacity=1)
+        self.index = self.store.add(
+            target_x, target_y, radius, color,
+            SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,  # Start from center
+            SPHERE_GROWTH_SPEED, SPHERE_MOVE_SPEED  # Use configurable constants
+        )
         
     def update(self):
-        # Handle sphere growth animation (appearing effect)
-        if self.is_growing and self.spawn_delay <= 0:
-            if self.radius < self.target_radius:
-                self.radius += self.growth_speed
-                if self.radius >= self.target_radius:
-                    self.radius = self.target_radius
-                    self.is_growing = False
-                    self.is_moving_to_target = True  # Start moving to target after growing
-        elif self.spawn_delay > 0:
-            self.spawn_delay -= 1
-        
-        # Move towards target position after growing
-        if self.is_moving_to_target and not self.is_growing:
-            dx = self.target_x - self.x
-            dy = self.target_y - self.y
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            if distance > 2:  # Still moving to target
-                # Calculate velocity towards target
-                self.velocity_x = dx * self.move_speed
-                self.velocity_y = dy * self.move_speed
-            else:
-                # Reached target, stop moving
-                self.x = self.target_x
-                self.y = self.target_y
-                self.velocity_x = 0
-                self.velocity_y = 0
-                self.is_moving_to_target = False
-        
-        # Update position
-        self.x += self.velocity_x
-        self.y += self.velocity_y
+        """Advance only this sphere - AutoSphereArt updates the whole store at once"""
+        self.store.step(np.array([self.index]))
     
-    def draw(self, screen):
-        # Only draw if sphere has some size
-        if self.radius <= 0:
-            return
-            
-        # Draw main sphere with growing effect
+    def blit_item(self, sprites=default_cache):
+        """Pre-rendered sprite and position for this sphere, or None while invisible"""
         current_radius = int(self.radius)
-        if current_radius > 0:
-            # Add a subtle glow effect during growth
-            if self.is_growing:
-                # Outer glow - ensure color values don't exceed 255
-                glow_radius = current_radius + 3
-                glow_color = tuple(min(255, int(c) + 50) for c in self.color)
-                pygame.draw.circle(screen, glow_color, (int(self.x), int(self.y)), glow_radius, 2)
-            
-            # Main sphere
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), current_radius)
-            pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), current_radius, 2)
+        if current_radius <= 0:
+            return None
+        
+        # Add a subtle glow effect during growth
+        effect = EFFECT_SPHERE_GLOW if self.is_growing else EFFECT_SPHERE
+        return sprites.blit_item(int(self.x), int(self.y), current_radius, self.color, effect)
+    
+    def draw(self, screen, sprites=default_cache):
+        item = self.blit_item(sprites)
+        if item is not None:
+            screen.blit(*item)
 
 class AutoSphereCreator:
     """Creates spheres automatically from image pattern"""
-    def __init__(self):
-        self.dot_queue = []
+    def __init__(self, cache=None):
+        self.dot_queue = DotQueue()
         self.is_active = False
         self.frame_counter = 0
         self.creation_delay = CREATION_DELAY  # Use configurable constant
+        self.cache = cache  # Optional LayoutCache for computed dot layouts
         
-    def load_pattern(self, image_path):
+    def load_pattern(self, image_path, seed=None):
         """Load image and create dot pattern data with enhanced detail detection"""
         try:
-            img = Image.open(image_path)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Scale image to fit screen with higher resolution preservation
-            img_width, img_height = img.size
-            scale = min(SCREEN_WIDTH/img_width, SCREEN_HEIGHT/img_height) * 0.85
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Calculate offset to center
-            offset_x = (SCREEN_WIDTH - new_width) // 2
-            offset_y = (SCREEN_HEIGHT - new_height) // 2
-            
-            img_array = np.array(img)
-            self.dot_queue = []
-            
-            # Enhanced sampling with adaptive sphere sizing based on local contrast
-            for y in range(0, new_height, SPHERE_SPACING):
-                for x in range(0, new_width, SPHERE_SPACING):
-                    if y >= img_array.shape[0] or x >= img_array.shape[1]:
-                        continue
-                        
-                    r, g, b = img_array[y, x]
-                    r, g, b = int(r), int(g), int(b)
-                    
-                    # More nuanced background detection for better detail capture
-                    brightness = (r + g + b) / 3
-                    if brightness > 250:  # Very bright pixels only
-                        continue
-                    
-                    # Calculate local contrast for adaptive sphere sizing
-                    local_contrast = self._calculate_local_contrast(img_array, x, y)
-                    
-                    # Adaptive radius based on local image characteristics
-                    if brightness < 50:  # Dark areas - smaller spheres for detail
-                        radius = random.randint(MIN_SPHERE_RADIUS, MIN_SPHERE_RADIUS + 3)
-                    elif local_contrast > 50:  # High contrast areas - medium spheres
-                        radius = random.randint(MIN_SPHERE_RADIUS + 2, MAX_SPHERE_RADIUS - 2)
-                    else:  # Uniform areas - larger spheres for efficiency
-                        radius = random.randint(MAX_SPHERE_RADIUS - 3, MAX_SPHERE_RADIUS)
-                    
-                    screen_x = x + offset_x + random.randint(-1, 1)
-                    screen_y = y + offset_y + random.randint(-1, 1)
-                    
-                    # Ensure within bounds with proper padding
-                    screen_x = max(radius + 2, min(SCREEN_WIDTH - radius - 2, screen_x))
-                    screen_y = max(radius + 2, min(SCREEN_HEIGHT - radius - 2, screen_y))
-                    
-                    dot_info = {
-                        'x': screen_x,
-                        'y': screen_y,
-                        'color': (r, g, b),
-                        'radius': radius
-                    }
-                    self.dot_queue.append(dot_info)
-            
-            # Sort by distance from center for natural growth pattern
-            center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
-            self.dot_queue.sort(key=lambda dot: 
-                math.sqrt((dot['x'] - center_x)**2 + (dot['y'] - center_y)**2))
-            
+            self.extract_pattern(image_path, seed)
             return True
             
         except Exception as e:
             print(f"Error loading pattern: {e}")
             return False
     
-    def _calculate_local_contrast(self, img_array, x, y):
-        """Calculate local contrast around a pixel for adaptive sphere sizing"""
-        try:
-            # Sample 3x3 neighborhood for contrast calculation
-            min_val, max_val = 255, 0
-            for dy in range(-1, 2):
-                for dx in range(-1, 2):
-                    ny, nx = y + dy, x + dx
-                    if (0 <= ny < img_array.shape[0] and 
-                        0 <= nx < img_array.shape[1]):
-                        pixel_brightness = sum(img_array[ny, nx]) / 3
-                        min_val = min(min_val, pixel_brightness)
-                        max_val = max(max_val, pixel_brightness)
-            
-            return max_val - min_val
-        except:
-            return 30  # Default moderate contrast
+    def extract_pattern(self, image_path, seed=None):
+        """Fill the dot queue from image_path, raising if the image can't be used"""
+        # A seeded layout is fully determined by the image and constants,
+        # so a warm start skips decoding and sampling altogether
+        cache_key = None
+        if self.cache is not None and seed is not None:
+            cache_key = self.cache.key(
+                image_path, spacing=SPHERE_SPACING, min_radius=MIN_SPHERE_RADIUS,
+                max_radius=MAX_SPHERE_RADIUS, screen=(SCREEN_WIDTH, SCREEN_HEIGHT), seed=seed,
+                alpha_cutoff=ALPHA_CUTOFF, sampling=SAMPLING_MODE, cells=(ADAPTIVE_MIN_CELL, ADAPTIVE_MAX_CELL),
+                detail=(ADAPTIVE_COLOR_STD, ADAPTIVE_EDGE_STRENGTH, ADAPTIVE_RADIUS_SCALE),
+                overlap=POISSON_OVERLAP)
+            layout = self.cache.load(cache_key)
+            if layout is not None:
+                self._set_queue(layout['x'], layout['y'], layout['color'], layout['radius'])
+                return
+        
+        # Scale image to fit screen with higher resolution preservation;
+        # large sources are reduced while decoding, never held at full size
+        img = load_fitted(image_path, (SCREEN_WIDTH, SCREEN_HEIGHT), 0.85, 'RGBA')
+        new_width, new_height = img.size
+        
+        # Calculate offset to center
+        offset_x = (SCREEN_WIDTH - new_width) // 2
+        offset_y = (SCREEN_HEIGHT - new_height) // 2
+        
+        # Transparent pixels are background, whatever color they hide
+        img_array = np.array(img)
+        rgb, opaque = img_array[..., :3], img_array[..., 3] >= ALPHA_CUTOFF
+        rng = np.random.default_rng(seed)
+        if SAMPLING_MODE == "adaptive":
+            dots_x, dots_y, colors, radii = self._extract_adaptive(rgb, opaque, offset_x, offset_y, rng)
+        elif SAMPLING_MODE == "poisson":
+            dots_x, dots_y, colors, radii = self._extract_poisson(rgb, opaque, offset_x, offset_y, rng)
+        else:
+            dots_x, dots_y, colors, radii = self._extract_dots(rgb, opaque, offset_x, offset_y, rng)
+        
+        # Sort by distance from center for natural growth pattern
+        # (stable sort keeps row-major order for equal distances)
+        center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+        order = np.argsort(np.hypot(dots_x - center_x, dots_y - center_y), kind='stable')
+        dots_x, dots_y, colors, radii = dots_x[order], dots_y[order], colors[order], radii[order]
+        
+        if cache_key is not None:
+            self.cache.store(cache_key, x=dots_x.astype(np.int16), y=dots_y.astype(np.int16),
+                             color=colors.astype(np.uint8), radius=radii.astype(np.uint8))
+        self._set_queue(dots_x, dots_y, colors, radii)
+    
+    def _set_queue(self, dots_x, dots_y, colors, radii):
+        """Build the dot queue from layout arrays already in creation order"""
+        self.dot_queue = DotQueue(dots_x, dots_y, colors, radii)
+    
+    def _extract_dots(self, img_array, opaque, offset_x, offset_y, rng):
+        """Sample the resized image on the sphere grid using array operations"""
+        # Strided sampling - every SPHERE_SPACING pixels in both directions
+        ys = np.arange(0, img_array.shape[0], SPHERE_SPACING)
+        xs = np.arange(0, img_array.shape[1], SPHERE_SPACING)
+        samples = img_array[ys[:, None], xs[None, :]].astype(np.int32)
+        
+        # More nuanced background detection for better detail capture
+        brightness = samples.sum(axis=2) / 3
+        keep = (brightness <= 250) & opaque[ys[:, None], xs[None, :]]  # Skip very bright pixels only
+        
+        # Calculate local contrast for adaptive sphere sizing
+        local_contrast = self._calculate_local_contrast(img_array, ys, xs)
+        
+        row, col = np.nonzero(keep)
+        brightness = brightness[row, col]
+        local_contrast = local_contrast[row, col]
+        colors = samples[row, col]
+        
+        # Adaptive radius based on local image characteristics:
+        # dark areas get smaller spheres for detail, high contrast areas medium
+        # spheres, uniform areas larger spheres for efficiency
+        low = np.where(brightness < 50, MIN_SPHERE_RADIUS,
+              np.where(local_contrast > 50, MIN_SPHERE_RADIUS + 2, MAX_SPHERE_RADIUS - 3))
+        high = np.where(brightness < 50, MIN_SPHERE_RADIUS + 3,
+               np.where(local_contrast > 50, MAX_SPHERE_RADIUS - 2, MAX_SPHERE_RADIUS))
+        radii = rng.integers(low, high + 1)
+        
+        screen_x = xs[col] + offset_x + rng.integers(-1, 2, size=len(col))
+        screen_y = ys[row] + offset_y + rng.integers(-1, 2, size=len(row))
+        
+        # Ensure within bounds with proper padding
+        screen_x = np.clip(screen_x, radii + 2, SCREEN_WIDTH - radii - 2)
+        screen_y = np.clip(screen_y, radii + 2, SCREEN_HEIGHT - radii - 2)
+        
+        return screen_x, screen_y, colors, radii
+    
+    def _extract_adaptive(self, img_array, opaque, offset_x, offset_y, rng):
+        """One sphere per leaf of the detail quadtree, sized to its cell"""
+        xs, ys, sizes, colors = quadtree_cells(
+            img_array, opaque, ADAPTIVE_MIN_CELL, ADAPTIVE_MAX_CELL,
+            ADAPTIVE_COLOR_STD, ADAPTIVE_EDGE_STRENGTH)
+        keep = colors.sum(axis=1) / 3 <= 250  # Same near-white cut as the grid
+        xs, ys, sizes, colors = xs[keep], ys[keep], sizes[keep], colors[keep]
+        
+        # Cells overlap their neighbours like grid spheres do; the smallest
+        # keep the grid's radius jitter so edges don't look stamped
+        radii = np.rint(sizes * ADAPTIVE_RADIUS_SCALE).astype(np.int64) + rng.integers(-1, 2, size=len(xs))
+        radii = np.maximum(radii, MIN_SPHERE_RADIUS)
+        
+        screen_x = xs.astype(np.int64) + offset_x + rng.integers(-1, 2, size=len(xs))
+        screen_y = ys.astype(np.int64) + offset_y + rng.integers(-1, 2, size=len(ys))
+        screen_x = np.clip(screen_x, radii + 2, SCREEN_WIDTH - radii - 2)
+        screen_y = np.clip(screen_y, radii + 2, SCREEN_HEIGHT - radii - 2)
+        
+        return screen_x, screen_y, colors, radii
+    
+    def _extract_poisson(self, img_array, opaque, offset_x, offset_y, rng):
+        """Blue-noise spheres, each kept clear of its neighbours by their radii"""
+        # The grid's sizing rules, evaluated at every pixel and centred in
+        # each of its radius ranges
+        ys, xs = np.arange(img_array.shape[0]), np.arange(img_array.shape[1])
+        brightness = img_array.sum(axis=2, dtype=np.int32) / 3
+        local_contrast = self._calculate_local_contrast(img_array, ys, xs)
+        radius_map = np.where(brightness < 50, MIN_SPHERE_RADIUS + 1.5,
+                     np.where(local_contrast > 50, (MIN_SPHERE_RADIUS + MAX_SPHERE_RADIUS) / 2,
+                              MAX_SPHERE_RADIUS - 1.5))
+        radius_map[(brightness > 250) | ~opaque] = 0
+        
+        px, py, radii = poisson_disk_samples(radius_map, POISSON_OVERLAP, rng)
+        col, row = px.astype(np.int64), py.astype(np.int64)
+        colors = img_array[row, col].astype(np.int32)
+        radii = np.rint(radii).astype(np.int64)
+        
+        screen_x = np.clip(col + offset_x, radii + 2, SCREEN_WIDTH - radii - 2)
+        screen_y = np.clip(row + offset_y, radii + 2, SCREEN_HEIGHT - radii - 2)
+        
+        return screen_x, screen_y, colors, radii
+    
+    def _calculate_local_contrast(self, img_array, ys, xs):
+        """Calculate 3x3 local contrast around each sampled pixel"""
+        # Neighbours outside the image are clamped to the edge, which leaves
+        # the min/max of the in-bounds neighbourhood unchanged
+        height, width = img_array.shape[:2]
+        min_val = np.full((len(ys), len(xs)), 255.0)
+        max_val = np.zeros((len(ys), len(xs)))
+        for dy in range(-1, 2):
+            ny = np.clip(ys + dy, 0, height - 1)
+            for dx in range(-1, 2):
+                nx = np.clip(xs + dx, 0, width - 1)
+                neighbour = img_array[ny[:, None], nx[None, :]].sum(axis=2, dtype=np.int32) / 3
+                np.minimum(min_val, neighbour, out=min_val)
+                np.maximum(max_val, neighbour, out=max_val)
+        
+        return max_val - min_val
     
     def start_creation(self):
         """Start automatic sphere creation"""
         self.is_active = True
         self.frame_counter = 0
     
-    def get_next_sphere(self):
-        """Get next sphere to create - ONE by ONE"""
+    def get_next_spheres(self, count=SPHERES_PER_STEP):
+        """Next slice of dots to spawn (empty between creation steps)"""
         if not self.is_active or not self.dot_queue:
-            return None
+            return self.dot_queue.take(0)
         
         self.frame_counter += 1
         if self.frame_counter >= self.creation_delay:
             self.frame_counter = 0
+            dots = self.dot_queue.take(count)
             
-            # Get ONLY ONE sphere at a time
-            if self.dot_queue:
-                sphere_data = self.dot_queue.pop(0)
-                
-                # Check if finished
-                if not self.dot_queue:
-                    self.is_active = False
-                
-                return sphere_data
-        
-        return None
+            # Check if finished
+            if not self.dot_queue:
+                self.is_active = False
+            
+            return dots
+        
+        return self.dot_queue.take(0)
     
     def is_creating(self):
         return self.is_active
     
     def remaining_count(self):
         return len(self.dot_queue)
+    
+    def timeline(self):
+        """Closed-form timeline of the whole loaded formation"""
+        dots = self.dot_queue.dots
+        return Timeline(dots['x'], dots['y'], dots['radius'], dots['color'],
+                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                        SPHERE_GROWTH_SPEED, SPHERE_MOVE_SPEED,
+                        self.creation_delay, SPHERES_PER_STEP)
+    
+    def seek(self, updates, spawned):
+        """Resume creation as it stands after the given number of updates"""
+        self.dot_queue.cursor = spawned
+        self.frame_counter = updates % self.creation_delay
+        self.is_active = bool(self.dot_queue)
 
 class AutoSphereArt:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(f"Auto Sphere Art - {IMAGE_NAME}")
+    def __init__(self, seed=None, profile_log=None, output_size=None, image_path=None, creator=None):
+        # The layout lives in SCREEN_WIDTH x SCREEN_HEIGHT; the viewport maps
+        # it onto a window or render target of any size
+        self.viewport = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT), output_size)
+        self.image_path = image_path or os.path.join("assets", "images", IMAGE_NAME)
+        self.image_name = os.path.basename(self.image_path)
+        self.screen = pygame.display.set_mode(self.viewport.size)
+        pygame.display.set_caption(f"Auto Sphere Art - {self.image_name}")
         self.clock = pygame.time.Clock()
-        self.spheres = []
+        self.sim_clock = SimClock(SIM_RATE)  # Simulation advances on real time, not frames
+        self.sphere_store = SphereStore()  # Array-backed state of every sphere
+        self.sprites = SpriteCache(max_sprites=16384, scale=self.viewport.scale)  # Pre-rendered sphere sprites
+        self.static_layer = StaticLayer(self.viewport.size, BLACK)  # Settled spheres
+        self.settled_pending = []  # Store indices settled since the last bake
+        self.dirty_rects = DirtyRectRenderer() if DIRTY_RECTS else None
+        self.profiler = FrameProfiler(profile_log)  # F3 toggles the timing overlay
+        self.quality = QualityGovernor(FRAME_BUDGET_MS, enabled=ADAPTIVE_QUALITY)
+        self.playhead = Playhead(SIM_RATE, self.viewport.size[0])  # Seek, scrub, reverse and speed
+        self.timeline = None  # Closed-form formation, for jumping to any step
+        self.updates = 0  # Simulation steps run since the formation started
+        self.baked_through = None  # Updates the static layer reflects after a seek
         self.running = True
-        self.sphere_creator = AutoSphereCreator()
+        self.seed = LAYOUT_SEED if seed is None else seed  # None re-jitters every load
+        self.sphere_creator = creator or AutoSphereCreator(LayoutCache() if LAYOUT_CACHE else None)
         
-        # Load image from configuration and AUTO START
-        image_path = os.path.join("assets", "images", IMAGE_NAME)
-        if os.path.exists(image_path):
-            success = self.sphere_creator.load_pattern(image_path)
+        # Load image from configuration (or --image) and AUTO START; a
+        # creator passed in has already extracted it
+        if creator is not None or os.path.exists(self.image_path):
+            success = creator is not None or self.sphere_creator.load_pattern(self.image_path, self.seed)
             if success:
                 # AUTO START - No need to press anything
                 self.sphere_creator.start_creation()
-                print(f"✅ Loaded {IMAGE_NAME} successfully!")
+                self._start_timeline()
+                print(f"✅ Loaded {self.image_name} successfully!")
             else:
-                print(f"❌ Failed to load {IMAGE_NAME}")
+                print(f"❌ Failed to load {self.image_name}")
         else:
-            print(f"❌ {IMAGE_NAME} not found in assets/images/")
+            print(f"❌ {self.image_path} not found")
             print("Available images:", os.listdir("assets/images"))
         
         print("🎯 Auto-creating spheres from center to form your image!")
@@ -265,6 +371,8 @@ class AutoSphereArt:
     def handle_events(self):
         """Handle pygame events - minimal controls for auto mode"""
         for event in pygame.event.get():
+            self.profiler.handle_event(event)
+            self.playhead.handle_event(event)
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -272,56 +380,200 @@ class AutoSphereArt:
                     self.running = False
                 elif event.key == pygame.K_SPACE:
                     # Restart the animation with configured image
-                    self.spheres.clear()
-                    image_path = os.path.join("assets", "images", IMAGE_NAME)
-                    if os.path.exists(image_path):
-                        self.sphere_creator.load_pattern(image_path)
+                    self.sphere_store.clear()
+                    self.static_layer.clear()
+                    self.settled_pending.clear()
+                    self.sim_clock.reset()
+                    if self.dirty_rects:
+                        self.dirty_rects.invalidate()
+                    if os.path.exists(self.image_path):
+                        self.sphere_creator.load_pattern(self.image_path, self.seed)
                         self.sphere_creator.start_creation()
-                        print(f"🔄 Restarting auto creation with {IMAGE_NAME}!")
+                        self._start_timeline()
+                        print(f"🔄 Restarting auto creation with {self.image_name}!")
     
     def update(self):
         """Update all spheres and handle automatic sphere creation"""
-        # Handle automatic sphere creation
-        new_sphere_data = self.sphere_creator.get_next_sphere()
-        if new_sphere_data:
-            sphere = Sphere(
-                new_sphere_data['x'], 
-                new_sphere_data['y'], 
-                new_sphere_data['radius'], 
-                new_sphere_data['color']
-            )
-            self.spheres.append(sphere)
-        
-        # Update all spheres (including growth and movement animation)
-        for sphere in self.spheres:
-            sphere.update()
+        # Handle automatic sphere creation - new dots go straight into the store
+        dots = self.sphere_creator.get_next_spheres()
+        if len(dots):
+            self.sphere_store.add_many(
+                dots['x'], dots['y'], dots['radius'], dots['color'],
+                SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,  # Start from center
+                SPHERE_GROWTH_SPEED, SPHERE_MOVE_SPEED)
+        self.profiler.mark('spawn')
+        
+        # Update all active spheres in one batched step (growth and movement);
+        # settled spheres drop out of the store's active set
+        settled = self.sphere_store.update()
+        if len(settled):
+            self.settled_pending.append(settled)
+        self.updates += 1
+        self.baked_through = None  # Live steps bake what settles themselves
+        self.profiler.mark('update')
+    
+    def seek(self, position):
+        """Show the formation at a fractional step straight from the timeline; returns alpha"""
+        step = int(position)
+        updates = step + 1  # Draw between the states after step and step + 1 updates
+        state = self.timeline.state(updates)
+        count = len(state['x'])
+        self.sphere_store.load(state, self.timeline.state(step, count))
+        self.sphere_creator.seek(updates, count)
+        self.updates = updates
+        
+        # The static layer can only gain spheres - extend it going forward and
+        # rebuild it when seeking back past spheres that settled
+        if self.baked_through is None or len(self.timeline.settled_between(updates, self.baked_through)):
+            self.static_layer.clear()
+            self.settled_pending.clear()
+            self.baked_through = 0
+            if self.dirty_rects:
+                self.dirty_rects.invalidate()
+        if updates > self.baked_through:
+            settled = self.timeline.settled_between(self.baked_through, updates)
+            self.settled_pending.append(settled)
+            self.baked_through = updates
+            # Spheres baked here were never drawn on screen, so present it whole
+            if len(settled) and self.dirty_rects:
+                self.dirty_rects.invalidate()
+        self.profiler.mark('update')
+        return position - step
+    
+    def _start_timeline(self):
+        """Build the timeline for a freshly started formation"""
+        self.timeline = self.sphere_creator.timeline()
+        self.playhead.reset(self.timeline.duration)
+        self.updates = 0
+        self.baked_through = None
     
-    def draw(self):
-        """Draw everything to the screen"""
-        # Always clear screen for clean animation
-        self.screen.fill(BLACK)
+    def draw(self, alpha=1.0):
+        """Draw everything, with spheres in flight alpha of the way into the next step"""
+        # Settled spheres never change again - composite them once into the
+        # static layer, which then stands in for clearing the screen
+        baked = []
+        if self.settled_pending:
+            baked = self.static_layer.bake(self._sphere_blits(np.concatenate(self.settled_pending)),
+                                           doreturn=self.dirty_rects is not None)
+            self.settled_pending.clear()
         
-        # Draw all spheres
-        for sphere in self.spheres:
-            sphere.draw(self.screen)
+        if self.dirty_rects:
+            # Restore only the regions spheres covered last frame, plus the
+            # newly baked spheres - drawn in flight at an interpolated
+            # position, they settle a little way off it
+            self.dirty_rects.erase(self.screen, self.static_layer.surface, baked)
+        else:
+            self.static_layer.draw(self.screen)
+        
+        # Draw spheres still in flight as one batch of pre-rendered sprites;
+        # each sprite's rect already covers its glow ring
+        rects = self.screen.blits(
+            self._sphere_blits(self.sphere_store.active, alpha, self.quality.settings),
+            doreturn=self.dirty_rects is not None)
         
-        # No text displays - full screen art only
-        pygame.display.flip()
+        # No text displays - full screen art only, apart from the profiler overlay
+        overlay_rect = self.profiler.draw_overlay(self.screen)
+        self.profiler.mark('draw')
+        if self.dirty_rects:
+            self.dirty_rects.present(rects + [overlay_rect], baked)
+        else:
+            pygame.display.flip()
+        self.profiler.mark('present')
+    
+    def is_finished(self):
+        """True once every sphere has been created and has settled"""
+        return not self.sphere_creator.is_creating() and len(self.sphere_store.active) == 0
+    
+    def profile_counts(self):
+        """Sphere counts reported to the frame profiler"""
+        store = self.sphere_store
+        active = store.active
+        return {
+            'alive': store.count,
+            'growing': int(store.is_growing[active].sum()),
+            'moving': int(store.is_moving_to_target[active].sum()),
+            'settled': store.count - len(active),
+            'allocations': self.sprites.frame_allocations(),
+            'quality': self.quality.level,
+        }
+    
+    def _sphere_blits(self, indices, alpha=1.0, quality=None):
+        """Sprite blit list for the spheres at the given store indices"""
+        store = self.sphere_store
+        sprites = self.sprites
+        # Baked spheres are drawn once, so they always get full quality
+        glow = quality is None or quality['glow']
+        outline_min_radius = self.viewport.length(quality['outline_min_radius']) if quality else 0
+        xs, ys, radii = store.interpolated(indices, alpha)
+        xs, ys = self.viewport.points(xs, ys)
+        items = []
+        for x, y, radius, color, growing in zip(
+                xs.tolist(), ys.tolist(),
+                self.viewport.lengths(radii).tolist(), store.color[indices].tolist(),
+                store.is_growing[indices].tolist()):
+            # Only draw if sphere has some size
+            if radius > 0:
+                if growing and glow:
+                    effect = EFFECT_SPHERE_GLOW
+                elif radius < outline_min_radius:
+                    effect = EFFECT_DISC
+                else:
+                    effect = EFFECT_SPHERE
+                items.append(sprites.blit_item(x, y, radius, tuple(color), effect))
+        return items
     
     def run(self):
         """Main game loop"""
         while self.running:
+            self.profiler.begin_frame()
             self.handle_events()
-            self.update()
-            self.draw()
+            self.profiler.mark('events')
+            # Run however many fixed steps real time calls for, then render
+            # between the last two of them; seeks, scrubbing, reverse and
+            # other speeds jump straight to the playhead instead
+            steps = self.sim_clock.tick()
+            alpha = self.sim_clock.alpha
+            position = self.playhead.advance(steps, alpha) if self.timeline else None
+            if position is None:
+                for _ in range(steps):
+                    self.update()
+                self.playhead.sync(self.updates, alpha)
+            else:
+                alpha = self.seek(position)
+            self.draw(alpha)
+            self.profiler.end_frame(**self.profile_counts())
+            if self.quality.record(self.profiler.last_work) and self.profiler.show_overlay:
+                print(f"⚙️ Quality level {self.quality.label}")
             self.clock.tick(FPS)
         
+        self.profiler.close()
         pygame.quit()
         sys.exit()
 
 def main():
     """Main function to run the auto sphere art application"""
-    app = AutoSphereArt()
+    parser = argparse.ArgumentParser(description="Auto Sphere Art")
+    parser.add_argument("--image", metavar="PATH",
+                        help=f"image to form (default: assets/images/{IMAGE_NAME})")
+    add_export_arguments(parser)
+    add_parallel_arguments(parser)
+    add_profiler_arguments(parser)
+    args = parser.parse_args()
+    size = output_size(parser, args, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    if is_export(args):
+        # Headless offline render - no window, no frame limiter
+        exporter = prepare_export(args)
+        app = AutoSphereArt(seed=args.seed, output_size=size, image_path=args.image)
+        if args.workers > 1:
+            export_parallel(app, exporter.output_dir, exporter.stream, args.frames,
+                            args.workers)
+        else:
+            export_frames(app, exporter, args.frames)
+        pygame.quit()
+        return
+    
+    app = AutoSphereArt(profile_log=args.profile_log, output_size=size, image_path=args.image)
     app.run()
 
 if __name__ == "__main__":
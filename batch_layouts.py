@@ -0,0 +1,286 @@
+"""
+Batch Layouts - Convert a directory of images into layouts and renders
+Every image is turned into its dot layout (and optionally a final-frame PNG
+or a full PNG sequence) in a pool of worker processes. A manifest in the
+output directory records each image's content hash and settings, so a rerun
+only redoes images that were added or changed; images that fail to decode
+are retried, then skipped and recorded instead of stopping the batch.
+
+    python batch_layouts.py logos/ --out layouts/ --render final
+    python batch_layouts.py logos/ --app drawings --render animation --size 1080p
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from layout_cache import LAYOUT_VERSION
+from viewport import parse_size
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp", ".ppm"}
+MANIFEST_NAME = "manifest.json"
+RETRIES = 1  # Extra attempts for an image before it is skipped
+RENDER_MODES = ("none", "final", "animation")
+
+
+def file_digest(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def find_images(input_dir):
+    """(name, path) for every image directly inside input_dir, sorted by name"""
+    images = []
+    for name in sorted(os.listdir(input_dir)):
+        path = os.path.join(input_dir, name)
+        if os.path.isfile(path) and os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+            images.append((name, path))
+    return images
+
+
+def output_names(names):
+    """Output directory per image: the file stem, plus the extension where stems clash"""
+    stems = [os.path.splitext(name)[0] for name in names]
+    return {name: stem if stems.count(stem) == 1 else name.replace(".", "_")
+            for name, stem in zip(names, stems)}
+
+
+def load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f).get("images", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path, entries):
+    """Write then rename so an interrupted batch never leaves a truncated manifest"""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump({"images": entries}, f, indent=1, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def is_current(entry, digest, params, out_dir):
+    """True if a manifest entry already covers this image content and these settings"""
+    if entry is None or entry.get("digest") != digest or entry.get("params") != params:
+        return False
+    if entry.get("status") == "failed":
+        return True  # Unchanged files that failed would only fail again
+    return all(os.path.exists(os.path.join(out_dir, output)) for output in entry.get("outputs", []))
+
+
+def _init_worker():
+    """Render headless in every worker process"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    # The apps' status and export prints would interleave; errors come back
+    # through the futures instead
+    sys.stdout = sys.stderr = open(os.devnull, "w")
+
+
+def _process_image(task):
+    """Extract (and render) one image, retrying failures; returns a manifest entry"""
+    path, target, params, retries = task
+    start = time.perf_counter()
+    error = None
+    for attempt in range(1, retries + 2):
+        try:
+            outputs, dots = _convert(path, target, params)
+            return dict(status="ok", dots=dots, outputs=outputs, attempts=attempt,
+                        seconds=round(time.perf_counter() - start, 3))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    return dict(status="failed", error=error, outputs=[], attempts=retries + 1,
+                seconds=round(time.perf_counter() - start, 3))
+
+
+def _convert(path, target, params):
+    """Write an image's layout and requested renders under target; returns (outputs, dots)"""
+    from offline_render import FrameExporter, export_frames, seed_everything
+
+    if params["app"] == "auto":
+        import auto_sphere_art as app_module
+        creator = app_module.AutoSphereCreator()
+        creator.extract_pattern(path, params["seed"])
+    else:
+        import sphere_drawings as app_module
+        seed_everything(params["seed"])
+        creator = app_module.ProgressiveDotCreator()
+        creator.extract_pattern(path)
+    dots = creator.dot_queue.dots
+    if not len(dots):
+        raise ValueError("no dots - the image is blank or entirely background")
+
+    os.makedirs(target, exist_ok=True)
+    outputs = ["layout.npz"]
+    temp_path = os.path.join(target, "layout.npz.tmp")
+    with open(temp_path, "wb") as f:
+        np.savez_compressed(f, x=dots['x'].astype(np.int16), y=dots['y'].astype(np.int16),
+                            color=dots['color'], radius=dots['radius'])
+    os.replace(temp_path, os.path.join(target, "layout.npz"))
+
+    if params["render"] == "none":
+        return outputs, len(dots)
+
+    # Seed exactly like a single --export run so the renders match it
+    seed_everything(params["seed"])
+    size = tuple(params["size"]) if params["size"] else None
+    if params["app"] == "auto":
+        # The layout above is the one the app would extract - reuse it
+        app = app_module.AutoSphereArt(seed=params["seed"], output_size=size, image_path=path,
+                                       creator=creator)
+    else:
+        app = app_module.SphereDrawings(output_size=size, image_path=path)
+
+    if params["render"] == "final":
+        if params["app"] == "auto":
+            # The timeline jumps straight to the settled formation
+            app.seek(app.timeline.duration)
+            app.draw()
+        else:
+            # Faded trails build up frame by frame, so play the export
+            # through without writing frames; its last frame stays on screen
+            export_frames(app, _DiscardFrames(), progress_every=0)
+        app_module.pygame.image.save(app.screen, os.path.join(target, "final.png"))
+        outputs.append("final.png")
+    else:
+        exporter = FrameExporter(output_dir=os.path.join(target, "frames"))
+        export_frames(app, exporter, params["frames"], progress_every=0)
+        outputs.append("frames")
+    return outputs, len(dots)
+
+
+class _DiscardFrames:
+    """Exporter that drops every frame, for playing an export through"""
+
+    def write(self, surface):
+        pass
+
+    def close(self):
+        pass
+
+
+def run_batch(input_dir, out_dir, params, workers=None, retries=RETRIES, force=False):
+    """Convert every new or changed image in input_dir; returns the number that failed"""
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+    images = find_images(input_dir)
+    targets = output_names([name for name, _ in images])
+
+    # Hash up front so unchanged images never reach the pool
+    pending = []
+    skipped = 0
+    for name, path in images:
+        try:
+            digest = file_digest(path)
+        except OSError as e:
+            print(f"❌ {name}: {e}")
+            continue
+        if not force and is_current(manifest.get(name), digest, params, out_dir):
+            skipped += 1
+            continue
+        pending.append((name, path, digest))
+    print(f"🗂️ {len(images)} images: {len(pending)} to convert, {skipped} unchanged")
+    if not pending:
+        return 0
+
+    workers = workers or os.cpu_count()
+    start = time.perf_counter()
+    done = failed = 0
+    total = len(pending)
+
+    def finish(name, digest, entry):
+        nonlocal done, failed
+        entry.update(digest=digest, params=params, target=targets[name])
+        entry["outputs"] = [os.path.join(targets[name], output) for output in entry["outputs"]]
+        manifest[name] = entry
+        save_manifest(manifest_path, manifest)  # After every image, so a rerun resumes
+
+        done += 1
+        rate = done / (time.perf_counter() - start)
+        if entry["status"] == "ok":
+            print(f"✅ [{done}/{total}] {name}: {entry['dots']} dots in {entry['seconds']:.1f}s "
+                  f"({rate:.2f} images/s)")
+        else:
+            failed += 1
+            print(f"❌ [{done}/{total}] {name}: {entry['error']} "
+                  f"(skipped after {entry['attempts']} attempts)")
+
+    crashed = _run_pool(pending, workers, out_dir, targets, params, retries, finish)
+    # A worker that dies outright (e.g. in a native decoder) breaks the whole
+    # pool, losing every image in flight; rerun those one at a time so the
+    # crash is pinned on the image that caused it
+    for item in crashed:
+        if _run_pool([item], 1, out_dir, targets, params, retries, finish):
+            finish(item[0], item[2], dict(status="failed", error="worker process crashed",
+                                          outputs=[], attempts=1))
+
+    elapsed = time.perf_counter() - start
+    print(f"🏁 Converted {done - failed} images, {failed} failed, in {elapsed:.1f}s "
+          f"({done / elapsed:.2f} images/s with {workers} workers)")
+    return failed
+
+
+def _run_pool(items, workers, out_dir, targets, params, retries, finish):
+    """Convert (name, path, digest) items in a process pool; returns those lost to a crash"""
+    crashed = []
+    with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(_process_image, (path, os.path.join(out_dir, targets[name]),
+                                                params, retries)): (name, path, digest)
+                   for name, path, digest in items}
+        for future in as_completed(futures):
+            name, path, digest = futures[future]
+            try:
+                entry = future.result()
+            except BrokenProcessPool:
+                crashed.append((name, path, digest))
+                continue
+            finish(name, digest, entry)
+    return crashed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a directory of images into sphere layouts and renders")
+    parser.add_argument("input_dir", help="directory of source images")
+    parser.add_argument("--out", default="batch_output", help="output directory (default: %(default)s)")
+    parser.add_argument("--app", choices=("auto", "drawings"), default="auto",
+                        help="pattern extraction of auto_sphere_art or sphere_drawings (default: auto)")
+    parser.add_argument("--render", choices=RENDER_MODES, default="none",
+                        help="also render the final frame or the whole animation (default: none)")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="stop animation renders after N frames (default: until settled)")
+    parser.add_argument("--size", type=parse_size, default=None, metavar="WxH",
+                        help="render resolution as WIDTHxHEIGHT or a preset like 4k (default: the app's screen size)")
+    parser.add_argument("--seed", type=int, default=0, help="layout and render seed (default: 0)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--retries", type=int, default=RETRIES,
+                        help="extra attempts before an image is skipped (default: %(default)s)")
+    parser.add_argument("--force", action="store_true", help="redo every image, changed or not")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"{args.input_dir} is not a directory")
+    params = dict(app=args.app, render=args.render, seed=args.seed,
+                  size=list(args.size) if args.size else None,
+                  frames=args.frames if args.render == "animation" else None,
+                  layout_version=LAYOUT_VERSION)
+    failed = run_batch(args.input_dir, args.out, params, args.workers, args.retries, args.force)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Benchmark - Headless timings for the layout, simulation and rendering hot paths
+Times grid, adaptive and Poisson-disk pattern extraction for every image in assets/images, circle packing at
+several sizes, sphere update/draw throughput at 1k/10k/50k spheres and timeline
+seeks to the end of formations that large. Results
+are written as JSON and can be compared against a saved baseline; the script
+exits non-zero when any benchmark regresses past the threshold.
+
+    python benchmark.py --baseline benchmark_baseline.json --save-baseline  # record
+    python benchmark.py --baseline benchmark_baseline.json                  # gate
+"""
+
+import os
+
+# Headless: must be set before pygame creates the display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+import pygame
+
+import auto_sphere_art
+import packed_circle_art
+from auto_sphere_art import AutoSphereArt, AutoSphereCreator
+from packed_circle_art import CirclePackingGenerator
+from image_guide import ImageGuide
+from timeline import Timeline
+
+IMAGES_DIR = os.path.join("assets", "images")
+PACKING_SIZES = [200, 800, 2000]
+GUIDE_IMAGE = os.path.join(IMAGES_DIR, "rrq.png")  # Source for the image-guided packing runs
+SPHERE_COUNTS = [1000, 10000, 50000]
+SIM_FRAMES = 30      # Frames stepped per update/draw measurement
+REPEATS = 5          # Measurements per benchmark
+THRESHOLD = 0.20     # Allowed slowdown before a benchmark counts as regressed
+SEED = 0
+
+
+def measure(run, setup=None, repeats=REPEATS):
+    """Time run() repeats times, calling setup() untimed before each; returns seconds"""
+    times = []
+    for _ in range(repeats):
+        if setup:
+            state = setup()
+            start = time.perf_counter()
+            run(state)
+        else:
+            start = time.perf_counter()
+            run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def summarize(times, per=1):
+    """Median and best time in milliseconds, divided by per (e.g. frames)"""
+    return {
+        "median_ms": statistics.median(times) * 1000 / per,
+        "min_ms": min(times) * 1000 / per,
+        "repeats": len(times),
+    }
+
+
+def quiet(func, *args, **kwargs):
+    """Call func with its status prints swallowed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def bench_layout(repeats):
+    """Pattern extraction (load_pattern) for every image in assets/images, per sampling mode"""
+    results = {}
+    sampling_mode = auto_sphere_art.SAMPLING_MODE
+    try:
+        for mode, prefix in (("grid", "layout"), ("adaptive", "layout/adaptive"),
+                             ("poisson", "layout/poisson")):
+            auto_sphere_art.SAMPLING_MODE = mode
+            for name in sorted(os.listdir(IMAGES_DIR)):
+                path = os.path.join(IMAGES_DIR, name)
+                creator = AutoSphereCreator()
+                times = measure(lambda: quiet(creator.load_pattern, path, SEED), repeats=repeats)
+                results[f"{prefix}/{name}"] = dict(summarize(times), dots=creator.dot_queue.total)
+    finally:
+        auto_sphere_art.SAMPLING_MODE = sampling_mode
+    return results
+
+
+def bench_packing(repeats):
+    """Random rejection packing at several max_circles values, whole, per step and image-guided"""
+    results = {}
+    guide = ImageGuide(GUIDE_IMAGE, packed_circle_art.SCREEN_WIDTH, packed_circle_art.SCREEN_HEIGHT,
+                       packed_circle_art.MIN_RADIUS, packed_circle_art.MAX_RADIUS)
+    for max_circles in PACKING_SIZES:
+        def setup():
+            random.seed(SEED)
+            return CirclePackingGenerator(packed_circle_art.SCREEN_WIDTH,
+                                          packed_circle_art.SCREEN_HEIGHT, seed=SEED)
+        times = measure(lambda generator: generator.generate_packed_circles(max_circles),
+                        setup, repeats)
+        results[f"packing/random/{max_circles}"] = summarize(times)
+        
+        # Longest single packing step: how far a progressive frame slice
+        # can overrun PACK_BUDGET_MS
+        steps = []
+        for _ in range(repeats):
+            generator = setup()
+            longest = 0.0
+            start = time.perf_counter()
+            for _ in generator.pack_random(max_circles):
+                now = time.perf_counter()
+                longest = max(longest, now - start)
+                start = now
+            steps.append(longest)
+        results[f"packing/step/{max_circles}"] = summarize(steps)
+        
+        def guided_setup():
+            random.seed(SEED)
+            return CirclePackingGenerator(packed_circle_art.SCREEN_WIDTH,
+                                          packed_circle_art.SCREEN_HEIGHT, seed=SEED, guide=guide)
+        times = measure(lambda generator: generator.generate_packed_circles(max_circles),
+                        guided_setup, repeats)
+        results[f"packing/guided/{max_circles}"] = summarize(times)
+    return results
+
+
+def fill_spheres(app, count, dots):
+    """Replace the app's spheres with count in-flight spheres tiled from a real layout"""
+    store = app.sphere_store
+    store.clear()
+    app.static_layer.clear()
+    app.settled_pending.clear()
+    rng = np.random.default_rng(SEED)
+    tiled = dots[np.arange(count) % len(dots)]
+    store.add_many(tiled['x'], tiled['y'], tiled['radius'], tiled['color'],
+                   auto_sphere_art.SCREEN_WIDTH // 2, auto_sphere_art.SCREEN_HEIGHT // 2,
+                   auto_sphere_art.SPHERE_GROWTH_SPEED, auto_sphere_art.SPHERE_MOVE_SPEED)
+    store.update()  # Activate everything that was just added
+
+    # Spread the spheres over every stage: growing, moving and almost arrived
+    store.radius[:count] = rng.uniform(0, store.target_radius[:count])
+    store.is_growing[:count] = rng.random(count) < 0.5
+    store.is_moving_to_target[:count] = ~store.is_growing[:count]
+    t = rng.random(count)
+    store.x[:count] += (store.target_x[:count] - store.x[:count]) * t
+    store.y[:count] += (store.target_y[:count] - store.y[:count]) * t
+
+
+def bench_spheres(app, repeats):
+    """SphereStore update and AutoSphereArt draw throughput per frame"""
+    dots = app.sphere_creator.dot_queue.dots
+    results = {}
+    for count in SPHERE_COUNTS:
+        def setup():
+            fill_spheres(app, count, dots)
+
+        def run_update(_):
+            for _ in range(SIM_FRAMES):
+                app.sphere_store.update()
+
+        def run_draw(_):
+            for _ in range(SIM_FRAMES):
+                app.draw()
+
+        times = measure(run_update, setup, repeats)
+        results[f"spheres/update/{count}"] = summarize(times, SIM_FRAMES)
+        times = measure(run_draw, setup, repeats)
+        results[f"spheres/draw/{count}"] = summarize(times, SIM_FRAMES)
+    return results
+
+
+def bench_timeline(app, repeats):
+    """Seeking straight to the end of a formation, including baking and one draw"""
+    dots = app.sphere_creator.dot_queue.dots
+    results = {}
+    for count in SPHERE_COUNTS:
+        tiled = dots[np.arange(count) % len(dots)]
+
+        def setup():
+            app.timeline = Timeline(
+                tiled['x'], tiled['y'], tiled['radius'], tiled['color'],
+                auto_sphere_art.SCREEN_WIDTH // 2, auto_sphere_art.SCREEN_HEIGHT // 2,
+                auto_sphere_art.SPHERE_GROWTH_SPEED, auto_sphere_art.SPHERE_MOVE_SPEED)
+            app.baked_through = None
+            return app.timeline
+
+        def run_seek(timeline):
+            app.seek(timeline.duration)
+            app.draw()
+
+        times = measure(run_seek, setup, repeats)
+        results[f"timeline/seek_end/{count}"] = summarize(times)
+    return results
+
+
+def run_benchmarks(repeats=REPEATS, only=None):
+    """Run every benchmark group whose name contains only (all when None)"""
+    results = {}
+    if not only or "layout" in only:
+        results.update(bench_layout(repeats))
+    if not only or "packing" in only:
+        results.update(bench_packing(repeats))
+    if not only or "spheres" in only:
+        app = quiet(AutoSphereArt, seed=SEED)
+        results.update(bench_spheres(app, repeats))
+    if not only or "timeline" in only:
+        app = quiet(AutoSphereArt, seed=SEED)
+        results.update(bench_timeline(app, repeats))
+    return results
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print a comparison table; returns the names that regressed
+
+    Best-of-N times are compared: scheduler noise only ever adds time, so the
+    minimum is the steadiest estimate on a shared machine.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<32}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<32}{'-':>12}{result['min_ms']:>10.2f}ms{'new':>10}")
+            continue
+        before = baseline[name]["min_ms"]
+        change = result["min_ms"] / before - 1 if before else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = " ❌"
+        print(f"{name:<32}{before:>10.2f}ms{result['min_ms']:>10.2f}ms{change:>+10.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless performance benchmarks")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="where to write this run's results (default: %(default)s)")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write this run's results to --baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown as a fraction, e.g. 0.2 = 20%% (default: %(default)s)")
+    parser.add_argument("--repeats", type=int, default=REPEATS,
+                        help="measurements per benchmark (default: %(default)s)")
+    parser.add_argument("--only", choices=["layout", "packing", "spheres", "timeline"], action="append",
+                        help="run only these benchmark groups")
+    args = parser.parse_args()
+
+    print("⏱️ Running benchmarks...")
+    results = run_benchmarks(args.repeats, args.only)
+    report = {"environment": environment(), "results": results}
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"📄 Results written to {args.output}")
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"📌 Baseline saved to {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) slower than baseline by more than "
+                  f"{args.threshold:.0%}: {', '.join(regressions)}")
+            pygame.quit()
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+    else:
+        for name, result in results.items():
+            print(f"{name:<32}{result['median_ms']:>10.2f}ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Dirty Rects - Partial repaint and presentation of changed screen regions
+Remembers the regions drawn last frame so they can be restored from the
+background, and presents only the union of old and new regions with
+pygame.display.update instead of flipping the whole surface.
+"""
+
+import pygame
+
+MERGE_THRESHOLD = 64  # Merge overlapping rects once a frame has more than this
+MAX_RECTS = 256       # Beyond this after merging, present one bounding rect
+
+
+def merge_rects(rects):
+    """Union overlapping rects until no two of them overlap"""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectRenderer:
+    """Tracks last frame's drawn regions and presents only what changed"""
+
+    def __init__(self, merge_threshold=MERGE_THRESHOLD, max_rects=MAX_RECTS):
+        self.merge_threshold = merge_threshold
+        self.max_rects = max_rects
+        self.previous = []  # Regions drawn in the last presented frame
+        self.full_redraw = True  # Next frame must repaint and present everything
+
+    def invalidate(self):
+        """Force a full repaint and flip on the next frame (e.g. after a restart)"""
+        self.full_redraw = True
+        self.previous = []
+
+    def erase(self, screen, background, changed=()):
+        """Restore last frame's regions and changed ones from a background surface or fill color"""
+        if self.full_redraw:
+            regions = [screen.get_rect()]
+        else:
+            regions = self.previous + list(changed)
+
+        for rect in regions:
+            if isinstance(background, pygame.Surface):
+                screen.blit(background, rect, rect)
+            else:
+                screen.fill(background, rect)
+
+    def present(self, rects, changed=()):
+        """Present last frame's and this frame's regions; rects become the new previous
+
+        changed are background regions that only need presenting this frame,
+        such as sprites just baked into the background.
+        """
+        rects = [pygame.Rect(rect) for rect in rects if rect]
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+            self.previous = rects
+            return
+
+        dirty = self.previous + rects + list(changed)
+        self.previous = rects
+        if len(dirty) > self.merge_threshold:
+            dirty = merge_rects(dirty)
+            if len(dirty) > self.max_rects:
+                dirty = [dirty[0].unionall(dirty[1:])]
+
+        if dirty:
+            pygame.display.update(dirty)
@@ -0,0 +1,44 @@
+"""
+Dot Queue - Compact structured-array queue of dots waiting to spawn
+Dots live in one NumPy structured array (12 bytes each) in creation order and
+are consumed through a cursor, so spawning is O(1) per step and whole slices
+can be taken at once.
+"""
+
+import numpy as np
+
+DOT_DTYPE = np.dtype([
+    ('x', np.int32),
+    ('y', np.int32),
+    ('color', np.uint8, (3,)),
+    ('radius', np.uint8),
+])
+
+
+class DotQueue:
+    """Dots in creation order, consumed front to back through a cursor"""
+
+    def __init__(self, x=(), y=(), color=(), radius=()):
+        self.dots = np.empty(len(x), dtype=DOT_DTYPE)
+        self.dots['x'] = x
+        self.dots['y'] = y
+        self.dots['color'] = np.reshape(color, (len(x), 3))
+        self.dots['radius'] = radius
+        self.cursor = 0
+
+    def __len__(self):
+        """Number of dots not yet taken"""
+        return len(self.dots) - self.cursor
+
+    def __bool__(self):
+        return self.cursor < len(self.dots)
+
+    @property
+    def total(self):
+        return len(self.dots)
+
+    def take(self, count=1):
+        """Remove and return the next count dots as a structured array view"""
+        start = self.cursor
+        self.cursor = min(start + count, len(self.dots))
+        return self.dots[start:self.cursor]
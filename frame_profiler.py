@@ -0,0 +1,181 @@
+"""
+Frame Profiler - Per-frame phase timings and sphere counts
+Apps mark the end of each phase of a frame (spawn, update, draw, present);
+the profiler keeps a rolling window of frames for p50/p95/p99 statistics,
+draws an optional overlay and streams every frame to a CSV or JSON-lines log.
+It also counts render-resource allocations and garbage collections per frame
+and shows the adaptive quality level.
+"""
+
+import csv
+import gc
+import json
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+PHASES = ("events", "spawn", "update", "draw", "present")
+# Sphere counts, render resources created, garbage collections run and quality level per frame
+COUNTS = ("alive", "growing", "moving", "settled", "allocations", "gc", "quality")
+COLUMNS = ("interval", "work") + PHASES  # Per-frame timings in ms; work excludes the idle wait
+WINDOW = 600       # Frames kept for the rolling percentiles
+STATS_EVERY = 30   # Recompute percentiles this often (frames)
+OVERLAY_KEY = pygame.K_F3
+OVERLAY_COLOR = (0, 255, 0)
+OVERLAY_BACKGROUND = (0, 0, 0, 180)
+OVERLAY_REFRESH = 10  # Frames between overlay text updates
+
+
+def add_profiler_arguments(parser):
+    """Add the frame profiler log option to an app's argument parser"""
+    parser.add_argument("--profile-log", metavar="PATH",
+                        help="stream per-frame phase timings to PATH (.csv, otherwise JSON lines)")
+
+
+class FrameProfiler:
+    """Collects phase timings per frame with rolling percentiles"""
+
+    def __init__(self, log_path=None, window=WINDOW):
+        self.frames = deque(maxlen=window)  # One tuple of COLUMNS per frame
+        self.frame_count = 0
+        self.last_work = 0.0  # Work time of the last finished frame in ms
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.counts = dict.fromkeys(COUNTS, 0)
+        self.stats = {}
+        self.show_overlay = False
+        self._frame_start = None
+        self._interval = 0.0
+        self._last_mark = time.perf_counter()
+        self._font = None
+        self._panel = None
+        self._gc_collections = 0
+        self._log_file = None
+        self._log = None
+        self._log_csv = False
+        if log_path:
+            self._open_log(log_path)
+
+    def begin_frame(self):
+        """Start timing a frame; the gap since the last frame start is its interval"""
+        now = time.perf_counter()
+        if self._frame_start is None:
+            # Count collections only once frames are timed; close() unhooks again
+            gc.callbacks.append(self._on_gc)
+        self._interval = (now - self._frame_start) * 1000 if self._frame_start else 0.0
+        self._frame_start = now
+        self._last_mark = now
+        # Phases not marked this frame stay at zero
+        for phase in PHASES:
+            self.current[phase] = 0.0
+
+    def mark(self, phase):
+        """Charge the time since the previous mark to phase"""
+        now = time.perf_counter()
+        self.current[phase] += (now - self._last_mark) * 1000
+        self._last_mark = now
+
+    def end_frame(self, **counts):
+        """Finish the frame, recording sphere counts (alive, growing, moving, settled)"""
+        self.counts.update(counts)
+        self.counts['gc'] = self._gc_collections
+        self._gc_collections = 0
+        work = (time.perf_counter() - self._frame_start) * 1000
+        self.last_work = work
+        self.frames.append((self._interval, work) + tuple(self.current[p] for p in PHASES))
+        self.frame_count += 1
+        if self.frame_count % STATS_EVERY == 0 or not self.stats:
+            self._update_stats()
+        if self._log:
+            self._write_log()
+
+    def percentiles(self, column):
+        """(p50, p95, p99) in ms of 'interval', 'work' or a phase over the window"""
+        return self.stats.get(column, (0.0, 0.0, 0.0))
+
+    def handle_event(self, event):
+        """Toggle the overlay on its key; returns True if the event was used"""
+        if event.type == pygame.KEYDOWN and event.key == OVERLAY_KEY:
+            self.show_overlay = not self.show_overlay
+            return True
+        return False
+
+    def draw_overlay(self, screen):
+        """Draw the stats panel if enabled; returns its rect (or None)"""
+        if not self.show_overlay:
+            self._panel = None
+            return None
+        if self._panel is None or self.frame_count % OVERLAY_REFRESH == 0:
+            self._panel = self._render_panel()
+        rect = self._panel.get_rect(topright=(screen.get_width() - 10, 10))
+        return screen.blit(self._panel, rect)
+
+    def _render_panel(self):
+        """Render the stats text into a translucent panel"""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+
+        lines = ["phase      last    p50    p95    p99"]
+        last_frame = self.frames[-1] if self.frames else (0.0,) * len(COLUMNS)
+        for column, last in zip(COLUMNS, last_frame):
+            p50, p95, p99 = self.percentiles(column)
+            lines.append(f"{column:<8}{last:>7.2f}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}")
+        lines.append("  ".join(f"{name}: {self.counts[name]}" for name in COUNTS[:4]))
+        lines.append("  ".join(f"{name}: {self.counts[name]}" for name in COUNTS[4:]))
+
+        surfaces = [self._font.render(line, True, OVERLAY_COLOR) for line in lines]
+        width = max(surface.get_width() for surface in surfaces) + 12
+        height = len(surfaces) * 16 + 8
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill(OVERLAY_BACKGROUND)
+        for i, surface in enumerate(surfaces):
+            panel.blit(surface, (6, 4 + i * 16))
+        return panel
+
+    def close(self):
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._log_file:
+            self._log_file.close()
+            self._log_file = None
+            self._log = None
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_collections += 1
+
+    def _update_stats(self):
+        data = np.array(self.frames)
+        p = np.percentile(data, (50, 95, 99), axis=0)
+        self.stats = {column: tuple(p[:, i].tolist()) for i, column in enumerate(COLUMNS)}
+
+    def _open_log(self, path):
+        """CSV for paths ending in .csv, JSON lines for anything else"""
+        self._log_file = open(path, "w", newline="")
+        self._log_csv = path.endswith(".csv")
+        if self._log_csv:
+            self._log = csv.writer(self._log_file)
+            self._log.writerow(["frame", "time"] + list(COLUMNS) + list(COUNTS) +
+                               ["work_p50", "work_p95", "work_p99"])
+        else:
+            self._log = self._log_file
+
+    def _write_log(self):
+        p50, p95, p99 = self.percentiles("work")
+        if self._log_csv:
+            self._log.writerow(
+                [self.frame_count, f"{time.time():.3f}"] +
+                [f"{value:.3f}" for value in self.frames[-1]] +
+                [self.counts[name] for name in COUNTS] +
+                [f"{p50:.3f}", f"{p95:.3f}", f"{p99:.3f}"])
+        else:
+            record = {
+                "frame": self.frame_count,
+                "time": round(time.time(), 3),
+                "ms": {column: round(value, 3)
+                       for column, value in zip(COLUMNS, self.frames[-1])},
+                "counts": dict(self.counts),
+                "work_p50": round(p50, 3), "work_p95": round(p95, 3), "work_p99": round(p99, 3),
+            }
+            self._log.write(json.dumps(record) + "\n")
@@ -0,0 +1,91 @@
+"""
+Free Space Field - Incremental distance field for maximal circle packing
+Stores, for every pixel, the largest radius a circle centred there could take
+without leaving the canvas or touching a placed circle. Placing a circle only
+updates the pixels within its reach, and per-tile maxima make finding the
+roomiest spot cheap.
+"""
+
+import numpy as np
+
+
+class FreeSpaceField:
+    """Capped free-space distance field over a width x height canvas"""
+
+    def __init__(self, width, height, cap, padding=0, tile_size=32, slack=1.0, seed=None,
+                 limit=None):
+        self.width = width
+        self.height = height
+        self.cap = cap  # Room is never reported above this radius
+        self.padding = padding  # Minimum gap kept between circles
+        self.tile_size = tile_size
+        self.slack = slack  # Spots within slack of the best room count as ties
+        self.rng = np.random.default_rng(seed)
+
+        # Field is padded to whole tiles; padding pixels never get picked
+        tiles_y = -(-height // tile_size)
+        tiles_x = -(-width // tile_size)
+        self.field = np.full((tiles_y * tile_size, tiles_x * tile_size), -1.0, dtype=np.float32)
+
+        # Initial room is the distance from each pixel centre to the border
+        centres_x = np.arange(width, dtype=np.float32) + 0.5
+        centres_y = np.arange(height, dtype=np.float32) + 0.5
+        border_x = np.minimum(centres_x, width - centres_x)
+        border_y = np.minimum(centres_y, height - centres_y)
+        room = self.field[:height, :width]
+        np.minimum(np.minimum(border_y, cap)[:, None], np.minimum(border_x, cap)[None, :], out=room)
+
+        # An optional per-pixel cap on top; pixels capped at 0 never get picked
+        if limit is not None:
+            np.minimum(room, limit, out=room)
+            room[limit <= 0] = -1.0
+
+        self.tile_max = self._tile_maxima(0, 0, tiles_y, tiles_x)
+
+    def _tile_maxima(self, ty0, tx0, ty1, tx1):
+        """Maximum room inside each tile of the given tile range"""
+        t = self.tile_size
+        block = self.field[ty0 * t:ty1 * t, tx0 * t:tx1 * t]
+        return block.reshape(ty1 - ty0, t, tx1 - tx0, t).max(axis=(1, 3))
+
+    def best(self, minimum=None):
+        """Pick one of the roomiest spots; returns (x, y, room)
+
+        Spots with less room than minimum never count as ties, so while any
+        spot has that much room, the one picked does too.
+        """
+        top = self.tile_max.max()
+        # Break ties randomly so large circles don't line up from a corner
+        floor = top - self.slack if minimum is None else min(top, max(top - self.slack, minimum))
+        tiles = np.flatnonzero(self.tile_max >= floor)
+        ty, tx = divmod(int(self.rng.choice(tiles)), self.tile_max.shape[1])
+
+        t = self.tile_size
+        tile = self.field[ty * t:(ty + 1) * t, tx * t:(tx + 1) * t]
+        spots = np.flatnonzero(tile >= floor)
+        py, px = divmod(int(self.rng.choice(spots)), t)
+
+        y = ty * t + py
+        x = tx * t + px
+        return x + 0.5, y + 0.5, float(self.field[y, x])
+
+    def carve(self, x, y, radius):
+        """Account for a circle placed at (x, y), updating only the pixels it can affect"""
+        # Beyond this distance the circle can't lower a room below the cap
+        reach = int(np.ceil(radius + self.padding + self.cap))
+        x0 = max(0, int(x) - reach)
+        x1 = min(self.width, int(x) + reach + 1)
+        y0 = max(0, int(y) - reach)
+        y1 = min(self.height, int(y) + reach + 1)
+
+        dx = np.arange(x0, x1, dtype=np.float32) + 0.5 - x
+        dy = np.arange(y0, y1, dtype=np.float32) + 0.5 - y
+        room = np.sqrt(dy[:, None]**2 + dx[None, :]**2) - radius - self.padding
+        window = self.field[y0:y1, x0:x1]
+        np.minimum(window, room, out=window)
+
+        # Refresh the maxima of the tiles touched by the window
+        t = self.tile_size
+        ty0, tx0 = y0 // t, x0 // t
+        ty1, tx1 = -(-y1 // t), -(-x1 // t)
+        self.tile_max[ty0:ty1, tx0:tx1] = self._tile_maxima(ty0, tx0, ty1, tx1)
@@ -0,0 +1,95 @@
+"""
+Image Guide - Source image lookups for image-guided circle packing
+The image is fitted and centred on the packing canvas. A summed-area table of
+its opaque pixel colors gives the mean color under any circle from four
+corner reads, and a per-pixel radius limit, precomputed from the share of
+artwork and the edge density around each pixel, keeps large circles on flat,
+solid areas and small ones on detail and along the outline. Both lookups
+are constant-time, so guided packing runs at the speed of plain packing.
+"""
+
+import numpy as np
+
+from adaptive_sampling import summed_area_table, box_sums
+from image_loader import load_fitted
+
+FILL = 0.85  # Share of the canvas the fitted image spans
+ALPHA_CUTOFF = 32  # Pixels less opaque than this are background
+BACKGROUND_BRIGHTNESS = 250  # Near-white pixels are background too, as in Auto Sphere Art
+COVERAGE = 0.8  # Share of a circle's box that must be artwork
+EDGE_STRENGTH = 4  # Mean luminance change per pixel above which a box counts as detail
+RADIUS_STEP = 3  # Spacing of the radius limits tested per pixel
+
+
+class ImageGuide:
+    """Color and radius-limit lookups for packing circles into an image"""
+
+    def __init__(self, image_path, width, height, min_radius, max_radius):
+        img = load_fitted(image_path, (width, height), FILL, 'RGBA')
+        pixels = np.array(img)
+        x0, y0 = (width - img.width) // 2, (height - img.height) // 2
+        self.bounds = (x0, y0, x0 + img.width, y0 + img.height)
+
+        # Artwork mask and colors, placed on the canvas
+        rgb = pixels[..., :3].astype(np.float64)
+        artwork = ((pixels[..., 3] >= ALPHA_CUTOFF) &
+                   (rgb.sum(axis=2) / 3 <= BACKGROUND_BRIGHTNESS))
+        mask = np.zeros((height, width))
+        mask[y0:y0 + img.height, x0:x0 + img.width] = artwork
+        colors = np.zeros((height, width, 3))
+        colors[y0:y0 + img.height, x0:x0 + img.width] = rgb * artwork[..., None]
+        self.table = summed_area_table(np.concatenate([mask[..., None], colors], axis=-1))
+        self.width, self.height = width, height
+
+        # Edge energy of the artwork as drawn on the black canvas, so the
+        # outline counts as detail as well
+        luminance = colors @ np.array([0.299, 0.587, 0.114])
+        edges = np.zeros((height, width))
+        edges[:, :-1] += np.abs(np.diff(luminance, axis=1))
+        edges[:-1, :] += np.abs(np.diff(luminance, axis=0))
+
+        self.radius_limit = self._radius_limits(mask, edges, min_radius, max_radius)
+
+    def _radius_limits(self, mask, edges, min_radius, max_radius):
+        """Largest tested radius whose box, and every smaller one, is solid and flat enough
+
+        0 marks pixels where not even min_radius fits.
+        """
+        # Zero-padded tables let every box be taken as plain slices
+        pad = max_radius + 1
+        coverage = summed_area_table(np.pad(mask, pad))
+        detail = summed_area_table(np.pad(edges, pad))
+        height, width = mask.shape
+
+        def box_means(table, radius):
+            lo, hi = pad - radius, pad + radius + 1
+            sums = (table[hi:hi + height, hi:hi + width] - table[lo:lo + height, hi:hi + width] -
+                    table[hi:hi + height, lo:lo + width] + table[lo:lo + height, lo:lo + width])
+            return sums / (2 * radius + 1) ** 2
+
+        limit = np.zeros((height, width), dtype=np.int32)
+        fits = mask > 0
+        for radius in range(min_radius, max_radius + 1, RADIUS_STEP):
+            fits &= box_means(coverage, radius) >= COVERAGE
+            if radius > min_radius:
+                # The smallest circles may sit on detail - they draw it
+                fits &= box_means(detail, radius) <= EDGE_STRENGTH
+            limit[fits] = radius
+        return limit
+
+    @property
+    def background(self):
+        """Pixels no circle may be centred on"""
+        return self.radius_limit == 0
+
+    def limit(self, x, y):
+        """Largest radius a circle centred at (x, y) may take"""
+        return int(self.radius_limit[int(y), int(x)])
+
+    def color(self, x, y, radius):
+        """Mean artwork color inside the box around a circle"""
+        x0, y0 = max(0, int(x - radius)), max(0, int(y - radius))
+        x1, y1 = min(self.width, int(x + radius) + 1), min(self.height, int(y + radius) + 1)
+        sums = box_sums(self.table, x0, y0, x1, y1)
+        count = max(sums[0], 1)
+        return tuple(int(value / count + 0.5) for value in sums[1:])
@@ -0,0 +1,184 @@
+"""
+Image Loader - Memory-bounded loading of large source images
+Brings a source image down to the size a layout samples without decoding it
+at full resolution when it is much larger: JPEGs decode at a reduced DCT scale
+(draft), and uncompressed strip layouts (TIFF, BMP, PPM) read one band of
+rows at a time straight from the file, box-reducing each band as it arrives.
+Rows left over at the end of a band are carried into the next, so no reduced
+pixel straddles a seam and the result matches reducing the whole image at once.
+"""
+
+import contextlib
+import math
+
+from PIL import Image
+
+REDUCING_GAP = 3.0  # Box-reduce only while at least this much scale is left for the final resample
+BAND_BYTES = 16 * 1024 * 1024  # Decoded source rows held in memory at once
+MAX_SOURCE_PIXELS = 4_000_000_000  # Sources streamed in bands may be this large
+MAX_DECODED_PIXELS = 2 * 89_478_485  # Sources decoded whole must fit Pillow's bomb limit
+
+
+@contextlib.contextmanager
+def _large_images_allowed():
+    """Let Image.open accept sources past Pillow's decompression bomb limit"""
+    limit = Image.MAX_IMAGE_PIXELS
+    Image.MAX_IMAGE_PIXELS = None
+    try:
+        yield
+    finally:
+        Image.MAX_IMAGE_PIXELS = limit
+
+
+def load_fitted(image_path, bounds, fill=1.0, mode='RGB'):
+    """Open image_path resized to fill a share of bounds, keeping the aspect ratio
+
+    mode is 'RGB' or 'RGBA'; RGBA keeps transparency (opaque for sources without it).
+    """
+    with _large_images_allowed():
+        img = Image.open(image_path)
+    width, height = img.size
+    if width * height > MAX_SOURCE_PIXELS:
+        raise Image.DecompressionBombError(
+            f"{image_path} has {width * height} pixels, more than the {MAX_SOURCE_PIXELS} allowed")
+
+    scale = min(bounds[0] / width, bounds[1] / height) * fill
+    size = (int(width * scale), int(height * scale))
+    factors = _reduce_factors(img.size, size)
+    if factors == (1, 1):
+        # Small enough to resample directly from the full image
+        _check_decodable(image_path, img)
+        if img.mode != mode:
+            img = img.convert(mode)
+        return img.resize(size, Image.Resampling.LANCZOS)
+
+    if img.format == 'JPEG':
+        # Decode at the smallest DCT scale that still leaves room to resample
+        img.draft('RGB', (math.ceil(size[0] * REDUCING_GAP), math.ceil(size[1] * REDUCING_GAP)))
+        _check_decodable(image_path, img)
+        if img.mode != mode:
+            img = img.convert(mode)
+        return img.resize(size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+
+    strips = _raw_strips(img)
+    if strips is None:
+        # One compressed stream (PNG, WebP, deflate TIFF) only decodes whole
+        _check_decodable(image_path, img)
+        if img.mode != mode:
+            img = img.convert(mode)
+        return img.resize(size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+
+    # RGB matches Image.resize(reducing_gap=...) exactly. Image.resize drops
+    # reducing_gap for RGBA and resamples the full image with premultiplied
+    # alpha; the bands are reduced premultiplied too, but the box reduce still
+    # shifts opaque pixels by a few levels, up to about 20 at hard edges
+    work_mode = 'RGBa' if mode == 'RGBA' else mode
+    reduced = _reduce_in_bands(image_path, img, strips, factors, work_mode)
+    # Same box Image.resize(reducing_gap=...) uses after its own reduce
+    box = (0, 0, width / factors[0], height / factors[1])
+    return reduced.resize(size, Image.Resampling.LANCZOS, box=box).convert(mode)
+
+
+def _reduce_factors(source, size):
+    """Per-axis box reduction that leaves at least REDUCING_GAP for the final resample"""
+    return tuple(max(1, int(source[axis] / max(1, size[axis]) / REDUCING_GAP)) for axis in (0, 1))
+
+
+def _check_decodable(image_path, img):
+    width, height = img.size
+    if width * height > MAX_DECODED_PIXELS:
+        raise Image.DecompressionBombError(
+            f"{image_path} has {width * height} pixels and {img.format} can't be decoded in "
+            f"strips; save it as JPEG or uncompressed TIFF to load it")
+
+
+def _raw_strips(img):
+    """Full-width (y0, y1, offset, rawmode, stride, ystep) strips covering an uncompressed image, or None"""
+    width, height = img.size
+    if not img.tile or any(tile[0] != 'raw' for tile in img.tile):
+        return None
+    if any(tile[1][0] != 0 or tile[1][2] != width for tile in img.tile):
+        return None  # Tiled rather than striped
+
+    layouts = []
+    for tile in img.tile:
+        layout = _raw_layout(img, tile[3])
+        if layout is None:
+            return None
+        layouts.append(layout)
+
+    if len(img.tile) > 1:
+        return sorted((tile[1][1], tile[1][3], tile[2]) + layout
+                      for tile, layout in zip(img.tile, layouts))
+
+    # A single raw tile: cut it into strips of rows at computed byte offsets
+    offset = img.tile[0][2]
+    rawmode, stride, ystep = layouts[0]
+    rows = max(1, BAND_BYTES // (16 * width))  # A few strips make up one band
+    strips = []
+    for y0 in range(0, height, rows):
+        y1 = min(height, y0 + rows)
+        # Bottom-up files (ystep -1) store the last row first
+        start = offset + (y0 if ystep > 0 else height - y1) * stride
+        strips.append((y0, y1, start, rawmode, stride, ystep))
+    return strips
+
+
+def _raw_layout(img, args):
+    """(rawmode, stride, ystep) of a raw tile, with the row stride filled in, or None"""
+    args = (args,) if isinstance(args, str) else tuple(args)
+    rawmode = args[0]
+    stride = args[1] if len(args) > 1 else 0
+    ystep = args[2] if len(args) > 2 else 1
+    if not stride:
+        try:
+            bits = len(Image.new(img.mode, (8, 1)).tobytes('raw', rawmode))  # Bytes per 8 pixels
+        except (ValueError, OSError):
+            return None
+        stride = (bits * img.size[0] + 7) // 8
+    return rawmode, stride, ystep
+
+
+def _reduce_in_bands(image_path, img, strips, factors, mode):
+    """Box-reduce the image band by band; only one band is ever decoded at a time"""
+    width, height = img.size
+    reduced = Image.new(mode, (math.ceil(width / factors[0]), math.ceil(height / factors[1])))
+    band_rows = max(factors[1], BAND_BYTES // (4 * width))
+    carry = None  # Source rows not yet making up a whole reduced row
+    out_y = 0
+    i = 0
+    with open(image_path, 'rb') as source:
+        while i < len(strips):
+            # Gather strips up to the band budget
+            y0 = strips[i][0]
+            band_strips = []
+            while i < len(strips) and (not band_strips or strips[i][1] - y0 <= band_rows):
+                band_strips.append(strips[i])
+                i += 1
+            band = _decode_rows(source, img.mode, band_strips, width, mode)
+
+            if carry is not None:
+                joined = Image.new(mode, (width, carry.height + band.height))
+                joined.paste(carry, (0, 0))
+                joined.paste(band, (0, carry.height))
+                band = joined
+            last = i == len(strips)
+            rows = band.height if last else band.height // factors[1] * factors[1]
+            if rows:
+                part = band.crop((0, 0, width, rows)).reduce(factors)
+                reduced.paste(part, (0, out_y))
+                out_y += part.height
+            carry = band.crop((0, rows, width, band.height)) if rows < band.height else None
+    return reduced
+
+
+def _decode_rows(source, source_mode, strips, width, mode):
+    """Read and unpack only the given strips' rows from the open source file"""
+    y0 = strips[0][0]
+    band = Image.new(source_mode, (width, strips[-1][1] - y0))
+    for top, bottom, offset, rawmode, stride, ystep in strips:
+        source.seek(offset)
+        data = source.read(stride * (bottom - top))
+        strip = Image.frombytes(source_mode, (width, bottom - top), data, 'raw', rawmode, stride, ystep)
+        band.paste(strip, (0, top - y0))
+    return band if band.mode == mode else band.convert(mode)
@@ -0,0 +1,122 @@
+"""
+Layout Cache - Persistent on-disk cache of computed dot layouts
+Layouts are keyed by a hash of the image bytes plus every parameter that shapes
+the layout (spacing, radius limits, screen size, seed), stored as compressed
+.npz files and evicted least-recently-used once the cache grows past its limit.
+
+    python layout_cache.py --list    # show cached layouts
+    python layout_cache.py --clear   # drop every cached layout
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+
+import numpy as np
+
+CACHE_DIR = ".layout_cache"
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+LAYOUT_VERSION = 3  # Bump whenever dot extraction changes so old layouts miss
+
+
+class LayoutCache:
+    """Directory of .npz layouts with size-bounded LRU eviction"""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, image_path, **params):
+        """Hex key for an image file's contents and the layout parameters"""
+        digest = hashlib.sha256()
+        with open(image_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(json.dumps(dict(params, version=LAYOUT_VERSION), sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def load(self, key):
+        """Cached arrays for key as a dict, or None on a miss"""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError, KeyError):
+            return None
+
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)  # Mark as recently used for eviction
+        return arrays
+
+    def store(self, key, **arrays):
+        """Save arrays under key, then evict old layouts past the size limit"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        # Write then rename so a crash never leaves a truncated layout behind;
+        # the temp name is per process, as batch workers may store the same key
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(temp_path, path)
+        self.evict(keep=path)
+
+    def entries(self):
+        """(path, size, last used) for every cached layout, oldest first"""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".npz"):
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    continue  # Evicted by another process meanwhile
+                entries.append((os.path.join(self.cache_dir, name), stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self, keep=None):
+        """Remove least recently used layouts until the cache fits max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+                total -= size
+
+    def clear(self):
+        """Remove every cached layout; returns how many were removed"""
+        entries = self.entries()
+        for path, _, _ in entries:
+            os.remove(path)
+        return len(entries)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".npz")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the on-disk layout cache")
+    parser.add_argument("--dir", default=CACHE_DIR, help="cache directory (default: %(default)s)")
+    parser.add_argument("--clear", action="store_true", help="remove every cached layout")
+    parser.add_argument("--list", action="store_true", help="list cached layouts")
+    args = parser.parse_args()
+
+    cache = LayoutCache(args.dir)
+    if args.clear:
+        print(f"🗑️ Removed {cache.clear()} cached layouts from {args.dir}")
+    else:
+        entries = cache.entries()
+        if args.list:
+            for path, size, _ in entries:
+                print(f"{os.path.basename(path)}  {size / 1024:.1f} KB")
+        total = sum(size for _, size, _ in entries)
+        print(f"📦 {len(entries)} cached layouts, {total / 1024:.1f} KB in {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
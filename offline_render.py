@@ -0,0 +1,126 @@
+"""
+Offline Render - Headless frame export for the sphere and circle apps
+Runs an app without a window or frame limiter, stepping the simulation once
+per frame, and writes every frame as a PNG sequence or as raw RGB bytes for an
+external encoder such as ffmpeg.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from viewport import parse_size
+
+
+def add_export_arguments(parser):
+    """Add the headless export options to an app's argument parser"""
+    group = parser.add_argument_group("headless export")
+    group.add_argument("--export", metavar="DIR",
+                       help="render headless and write frames as DIR/frame_000000.png ...")
+    group.add_argument("--raw", action="store_true",
+                       help="render headless and write raw RGB frames to stdout "
+                            "(set PYGAME_HIDE_SUPPORT_PROMPT=1 so nothing else reaches the pipe)")
+    group.add_argument("--frames", type=int, default=None,
+                       help="number of frames to export (default: until the animation settles)")
+    group.add_argument("--seed", type=int, default=0,
+                       help="random seed for a deterministic export (default: 0)")
+    group.add_argument("--size", type=parse_size, default=None, metavar="WxH",
+                       help="output resolution as WIDTHxHEIGHT or 720p/1080p/1440p/4k/8k, up to "
+                            "8K (default: the app's screen size); the layout is unchanged")
+    group.add_argument("--scale", type=float, default=1.0,
+                       help="output size as a multiple of the screen size, unless --size is given "
+                            "(default: 1.0)")
+
+
+def output_size(parser, args, screen_size):
+    """Output size from --size or --scale; None keeps the app's screen size"""
+    if args.size is not None or args.scale == 1:
+        return args.size
+    try:
+        return parse_size(f"{int(screen_size[0] * args.scale)}x{int(screen_size[1] * args.scale)}")
+    except argparse.ArgumentTypeError as error:
+        parser.error(f"argument --scale: {error}")
+
+
+def is_export(args):
+    return bool(args.export or args.raw)
+
+
+def use_dummy_video_driver():
+    """Restart the display module on SDL's dummy driver so no window opens"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.quit()
+    pygame.display.init()
+
+
+def seed_everything(seed):
+    """Seed every random source the apps draw from"""
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+class FrameExporter:
+    """Writes rendered frames as numbered PNGs or a raw RGB stream"""
+
+    def __init__(self, output_dir=None, stream=None):
+        self.output_dir = output_dir
+        self.stream = stream
+        self.frame_count = 0
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+    def write(self, surface):
+        if self.stream is not None:
+            self.stream.write(pygame.image.tobytes(surface, "RGB"))
+        else:
+            path = os.path.join(self.output_dir, f"frame_{self.frame_count:06d}.png")
+            pygame.image.save(surface, path)
+        self.frame_count += 1
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.flush()
+
+
+def prepare_export(args):
+    """Switch to headless rendering and seed; returns the FrameExporter to use"""
+    use_dummy_video_driver()
+    seed_everything(args.seed)
+    if args.raw:
+        # Frames own stdout; route the apps' status prints to stderr
+        stream = sys.stdout.buffer
+        sys.stdout = sys.stderr
+        return FrameExporter(stream=stream)
+    return FrameExporter(output_dir=args.export)
+
+
+def export_frames(app, exporter, frames=None, progress_every=100):
+    """Step and draw the app as fast as possible, writing each frame
+
+    Every frame advances the simulation by exactly one update, so the output
+    only depends on the seed and never on how fast the machine renders.
+    """
+    start = time.perf_counter()
+    frame = 0
+    while frames is None or frame < frames:
+        app.update()
+        app.draw()
+        exporter.write(app.screen)
+        frame += 1
+
+        if progress_every and frame % progress_every == 0:
+            elapsed = time.perf_counter() - start
+            print(f"🎞️ {frame} frames ({frame / elapsed:.1f} fps)", file=sys.stderr)
+
+        if frames is None and app.is_finished():
+            break
+
+    exporter.close()
+    elapsed = time.perf_counter() - start
+    print(f"✅ Exported {frame} frames in {elapsed:.1f}s", file=sys.stderr)
+    return frame
@@ -4,12 +4,25 @@ Creates vibrant, densely packed circles of varying sizes that fill the entire ca
 """
 
 import pygame
-import math
-import random
+import argparse
 import sys
 import os
+import time
 import numpy as np
 from PIL import Image
+from spatial_grid import SpatialHashGrid
+from free_space_field import FreeSpaceField
+from sprite_cache import (SpriteCache, default_cache, EFFECT_DISC, EFFECT_SPHERE, EFFECT_SHADED,
+                          EFFECT_RING)
+from static_layer import StaticLayer
+from dirty_rects import DirtyRectRenderer
+from offline_render import add_export_arguments, is_export, prepare_export, export_frames, output_size
+from frame_profiler import FrameProfiler, add_profiler_arguments
+from sim_clock import SimClock
+from quality_governor import QualityGovernor
+from render_resources import RenderResources
+from viewport import Viewport, IDENTITY
+from image_guide import ImageGuide
 
 # Initialize Pygame
 pygame.init()
@@ -17,13 +30,26 @@ pygame.init()
 # Set reasonable window dimensions
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60  # Render frame cap; 0 renders uncapped
+SIM_RATE = 60  # Fixed simulation steps per second - animation speeds are per step
+ADAPTIVE_QUALITY = True  # Drop glow, gradients and small outlines when frames run over budget
+FRAME_BUDGET_MS = 1000 / 60
+DIRTY_RECTS = False  # Repaint and present only changed regions (for low-power displays)
 
 # Physics constants for circle packing
 MIN_RADIUS = 8
 MAX_RADIUS = 35
 PACK_ATTEMPTS = 100
 GROWTH_SPEED = 0.5
+CIRCLE_PADDING = 2  # Minimum gap between neighbouring circles
+CANDIDATE_BATCH = 4096  # Random candidate positions drawn per vectorized batch
+RANDOM_CHUNK = 64  # Radii, colors and growth speeds drawn per rng call
+RADIUS_LOW = (25, 15, MIN_RADIUS)        # Large, medium and small radii tried per
+RADIUS_HIGH = (MAX_RADIUS + 1, 26, 16)   # candidate, largest first (highs exclusive)
+PACKING_MODE = "random"  # "random" rejection sampling or "distance_field" maximal packing
+PACK_BUDGET_MS = 4  # Packing time per frame in the window; circles grow while the rest is packed
+REVEAL_SHARE = 0.05  # Share of packed circles still waiting that start growing each step, picked at random
+GUIDE_IMAGE = None  # Image (e.g. "assets/images/rrq.png") to pack into the shape and colors of; None fills the canvas
 
 # Vibrant color palette matching reference image
 VIBRANT_COLORS = [
@@ -53,14 +79,14 @@ WHITE = (255, 255, 255)
 class PackedCircle:
     """A circle in the packed circle art with growth animation"""
     
-    def __init__(self, x, y, target_radius, color):
+    def __init__(self, x, y, target_radius, color, growth_speed):
         self.x = float(x)
         self.y = float(y)
         self.target_radius = target_radius
         self.radius = 0.0  # Start with 0 radius
         self.color = color
         self.is_growing = True
-        self.growth_speed = random.uniform(0.3, 0.8)
+        self.growth_speed = growth_speed
         self.glow_intensity = 0
         
     def update(self):
@@ -76,50 +102,138 @@ class PackedCircle:
         if self.glow_intensity > 0:
             self.glow_intensity -= 0.5
     
-    def draw(self, screen):
-        """Render circle with visual effects"""
+    def is_settled(self):
+        """True once the circle has finished growing and its glow has faded"""
+        return not self.is_growing and self.glow_intensity <= 0
+    
+    def blit_items(self, sprites=default_cache, quality=None, viewport=IDENTITY):
+        """Pre-rendered sprites and positions for the glow and shaded circle"""
         if self.radius <= 0:
-            return
+            return []
             
-        current_radius = int(self.radius)
-        center_pos = (int(self.x), int(self.y))
+        current_radius = viewport.length(self.radius)
+        center_x, center_y = viewport.point(self.x, self.y)
+        items = []
         
         # Draw glow effect if present
-        if self.glow_intensity > 0:
-            glow_radius = current_radius + int(self.glow_intensity * 0.5)
+        if self.glow_intensity > 0 and (quality is None or quality['glow']):
+            glow_radius = current_radius + viewport.length(self.glow_intensity * 0.5)
             glow_color = tuple(min(255, c + int(self.glow_intensity)) for c in self.color)
-            pygame.draw.circle(screen, glow_color, center_pos, glow_radius, 3)
+            items.append(sprites.blit_item(center_x, center_y, glow_radius, glow_color,
+                                           (EFFECT_RING, 3)))
         
-        # Draw main circle with gradient effect
-        self._draw_gradient_circle(screen, center_pos, current_radius)
-        
-        # Draw white outline for definition
-        pygame.draw.circle(screen, WHITE, center_pos, current_radius, 2)
-    
-    def _draw_gradient_circle(self, screen, center_pos, radius):
-        """Draw circle with gradient shading for depth"""
-        # Draw multiple concentric circles for gradient effect
-        for i in range(radius, 0, -1):
-            intensity = i / radius
-            shaded_color = tuple(int(c * (0.4 + 0.6 * intensity)) for c in self.color)
-            pygame.draw.circle(screen, shaded_color, center_pos, i)
+        # Draw main circle with gradient shading and white outline for definition;
+        # reduced quality flat-shades it and drops the outline on small circles
+        if current_radius > 0:
+            if quality is None or quality['gradient']:
+                effect = EFFECT_SHADED
+            elif current_radius < viewport.length(quality['outline_min_radius']):
+                effect = EFFECT_DISC
+            else:
+                effect = EFFECT_SPHERE
+            items.append(sprites.blit_item(center_x, center_y, current_radius, self.color,
+                                           effect))
+        return items
+    
+    def draw(self, screen, sprites=default_cache):
+        """Render circle with visual effects"""
+        screen.blits(self.blit_items(sprites), doreturn=False)
 
 class CirclePackingGenerator:
     """Generates densely packed circles using circle packing algorithms"""
     
-    def __init__(self, width, height):
+    def __init__(self, width, height, seed=None, guide=None):
         self.width = width
         self.height = height
+        # Optional ImageGuide: circles then take their colors and size
+        # limits from an image and stay on its artwork
+        self.guide = guide
+        self.area = guide.bounds if guide else (0, 0, width, height)
         self.circles = []
         self.generation_complete = False
+        self.rng = np.random.default_rng(seed)
+        # Spatial index of placed circles, kept in sync by _add_circle.
+        # Cells span the largest possible collision distance, so a query
+        # only touches the neighbouring cells.
+        self.grid = SpatialHashGrid(2 * MAX_RADIUS + CIRCLE_PADDING)
+        # Pixels where not even a MIN_RADIUS circle fits any more (to pixel
+        # precision); lets candidates be rejected without a grid query
+        self.blocked = np.zeros((height, width), dtype=bool)
+        self._stamps = {}
         
     def check_collision(self, x, y, radius):
         """Check if a new circle collides with existing circles"""
-        for circle in self.circles:
-            distance = math.sqrt((x - circle.x)**2 + (y - circle.y)**2)
-            if distance < (radius + circle.target_radius + 2):  # Small padding
-                return True
-        return False
+        return self.grid.collides(x, y, radius, CIRCLE_PADDING)
+    
+    def largest_fit(self, x, y, limit, minimum=0):
+        """Largest radius up to limit that fits at (x, y) in bounds and without collision"""
+        bound = min(limit, x, self.width - x, y, self.height - y)
+        if bound < minimum:
+            return bound
+        return self.grid.free_radius(x, y, bound, CIRCLE_PADDING, minimum)
+    
+    def _radius_limit(self, x, y, limit):
+        """limit, lowered to the guide image's limit at (x, y)"""
+        return min(limit, self.guide.limit(x, y)) if self.guide else limit
+    
+    def _pick_color(self, x, y, radius):
+        """The guide image's mean color under the circle, or a random vibrant one"""
+        if self.guide:
+            return self.guide.color(x, y, radius)
+        return VIBRANT_COLORS[next(self._colors)]
+    
+    def _reset(self):
+        """Drop every placed circle; only the guide image's background stays blocked"""
+        self.circles = []
+        self.grid.clear()
+        self.blocked[:] = self.guide.background if self.guide else False
+        self.generation_complete = False
+        # Every random choice comes from the seeded rng, so a seed fixes the packing
+        self._radii = self._draws(lambda n: self.rng.integers(RADIUS_LOW, RADIUS_HIGH, (n, 3)))
+        self._colors = self._draws(lambda n: self.rng.integers(len(VIBRANT_COLORS), size=n))
+        self._speeds = self._draws(lambda n: self.rng.uniform(0.3, 0.8, n))
+    
+    def _draws(self, draw):
+        """Endless values from draw(RANDOM_CHUNK), one rng call per chunk"""
+        while True:
+            yield from draw(RANDOM_CHUNK).tolist()
+    
+    def _add_circle(self, x, y, radius, color):
+        """Place a circle and register it in the spatial index"""
+        circle = PackedCircle(x, y, radius, color, next(self._speeds))
+        self.circles.append(circle)
+        self.grid.insert(circle.x, circle.y, radius)
+        self._block_area(x, y, radius + CIRCLE_PADDING + MIN_RADIUS)
+        return circle
+    
+    def _block_area(self, x, y, reach):
+        """Mark pixels lying closer than reach to (x, y) as blocked"""
+        stamp = self._stamps.get(reach)
+        if stamp is None:
+            offsets = np.arange(-reach, reach + 1)
+            stamp = offsets[:, None]**2 + offsets[None, :]**2 < reach*reach
+            self._stamps[reach] = stamp
+        
+        cx, cy = int(x), int(y)
+        x0, y0 = max(0, cx - reach), max(0, cy - reach)
+        x1 = min(self.width, cx + reach + 1)
+        y1 = min(self.height, cy + reach + 1)
+        if x0 < x1 and y0 < y1:
+            self.blocked[y0:y1, x0:x1] |= stamp[y0 - cy + reach:y1 - cy + reach,
+                                                 x0 - cx + reach:x1 - cx + reach]
+    
+    def _free_candidates(self, count, margin):
+        """Random candidate positions, pre-filtered against the blocked mask"""
+        x0, y0, x1, y1 = self.area
+        xs = self.rng.uniform(max(x0, margin), min(x1, self.width - margin), count)
+        ys = self.rng.uniform(max(y0, margin), min(y1, self.height - margin), count)
+        free = ~self.blocked[ys.astype(np.intp), xs.astype(np.intp)]
+        
+        blocked_rows = self.blocked
+        for x, y in zip(xs[free].tolist(), ys[free].tolist()):
+            # Circles placed earlier in this batch may have blocked the spot
+            if not blocked_rows[int(y), int(x)]:
+                yield x, y
     
     def is_in_bounds(self, x, y, radius):
         """Check if circle is within screen boundaries"""
@@ -128,82 +242,192 @@ class CirclePackingGenerator:
     
     def generate_packed_circles(self, max_circles=800):
         """Generate densely packed circles similar to reference image"""
-        self.circles = []
+        for _ in self.pack_random(max_circles):
+            pass
+        
+        # Shuffle for random growth order
+        self.rng.shuffle(self.circles)
+        return self.circles
+    
+    def pack_random(self, max_circles=800):
+        """Random packing, one step at a time
+        
+        Yields each circle as it is placed, or None after a rejected
+        candidate, so callers can stop after any step and resume later.
+        """
+        self._reset()
         attempts = 0
         max_attempts = max_circles * 50
         
         while len(self.circles) < max_circles and attempts < max_attempts:
-            attempts += 1
-            
-            # Random position
-            x = random.uniform(MAX_RADIUS, self.width - MAX_RADIUS)
-            y = random.uniform(MAX_RADIUS, self.height - MAX_RADIUS)
+            batch = min(CANDIDATE_BATCH, max_attempts - attempts)
+            attempts += batch
             
-            # Try different radii, starting from larger to smaller
-            radius_attempts = [
-                random.randint(25, MAX_RADIUS),  # Large circles
-                random.randint(15, 25),          # Medium circles
-                random.randint(MIN_RADIUS, 15)   # Small circles
-            ]
-            
-            for radius in radius_attempts:
-                if (self.is_in_bounds(x, y, radius) and 
-                    not self.check_collision(x, y, radius)):
-                    
-                    # Choose vibrant color
-                    color = random.choice(VIBRANT_COLORS)
-                    circle = PackedCircle(x, y, radius, color)
-                    self.circles.append(circle)
+            # Random positions
+            for x, y in self._free_candidates(batch, MAX_RADIUS):
+                # One grid query gives the room available for every radius below
+                fit = self.largest_fit(x, y, self._radius_limit(x, y, MAX_RADIUS), MIN_RADIUS)
+                if fit < MIN_RADIUS:
+                    yield None
+                    continue
+                
+                # Try a large, a medium and a small radius, largest first
+                circle = None
+                for radius in next(self._radii):
+                    if radius <= fit:
+                        color = self._pick_color(x, y, radius)
+                        circle = self._add_circle(x, y, radius, color)
+                        break
+                yield circle
+                
+                if len(self.circles) >= max_circles:
                     break
         
         # Fill remaining gaps with smaller circles
-        self._fill_gaps()
-        
-        # Shuffle for random growth order
-        random.shuffle(self.circles)
+        yield from self._fill_gaps()
         self.generation_complete = True
+    
+    def generate_distance_field_circles(self, max_circles=None):
+        """Generate a maximal packing by always filling the roomiest spot left"""
+        for _ in self.pack_distance_field(max_circles):
+            pass
         
+        # Shuffle for random growth order
+        self.rng.shuffle(self.circles)
         return self.circles
     
+    def pack_distance_field(self, max_circles=None):
+        """Distance-field packing, yielding each circle as it is placed"""
+        self._reset()
+        field = FreeSpaceField(self.width, self.height, MAX_RADIUS, CIRCLE_PADDING,
+                               seed=self.rng.integers(2**32),
+                               limit=self.guide.radius_limit if self.guide else None)
+        
+        # Every placement succeeds, so the run takes a fixed number of steps
+        while max_circles is None or len(self.circles) < max_circles:
+            x, y, room = field.best(MIN_RADIUS)
+            if room < MIN_RADIUS:
+                break  # No gap left that can hold even the smallest circle
+            
+            radius = int(room)
+            color = self._pick_color(x, y, radius)
+            circle = self._add_circle(x, y, radius, color)
+            field.carve(x, y, radius)
+            yield circle
+        
+        self.generation_complete = True
+    
     def _fill_gaps(self):
-        """Fill remaining gaps with smaller circles for denser packing"""
+        """Fill remaining gaps with smaller circles for denser packing, yielding like pack_random"""
         gap_fill_attempts = 5000
         
-        for _ in range(gap_fill_attempts):
-            x = random.uniform(MIN_RADIUS, self.width - MIN_RADIUS)
-            y = random.uniform(MIN_RADIUS, self.height - MIN_RADIUS)
+        for x, y in self._free_candidates(gap_fill_attempts, MIN_RADIUS):
+            fit = self.largest_fit(x, y, self._radius_limit(x, y, 15), MIN_RADIUS)
             
             # Try small radii for gap filling
+            circle = None
             for radius in range(MIN_RADIUS, 15):
-                if (self.is_in_bounds(x, y, radius) and 
-                    not self.check_collision(x, y, radius)):
-                    
-                    color = random.choice(VIBRANT_COLORS)
-                    circle = PackedCircle(x, y, radius, color)
-                    self.circles.append(circle)
+                if radius <= fit:
+                    color = self._pick_color(x, y, radius)
+                    circle = self._add_circle(x, y, radius, color)
                     break
+            yield circle
 
 class PackedCircleArt:
     """Main application for packed circle art generation"""
     
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, seed=None, profile_log=None, output_size=None, progressive=False,
+                 image_path=None):
+        # Circles are packed in SCREEN_WIDTH x SCREEN_HEIGHT and drawn through
+        # the viewport at the window or export size
+        self.viewport = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT), output_size)
+        self.screen = pygame.display.set_mode(self.viewport.size)
         pygame.display.set_caption("Packed Circle Art - Dense Circle Packing")
         self.clock = pygame.time.Clock()
+        self.sim_clock = SimClock(SIM_RATE)  # Simulation advances on real time, not frames
         self.running = True
         self.show_info = True
+        self.packing_mode = PACKING_MODE
+        self.sprites = SpriteCache(scale=self.viewport.scale)  # Pre-rendered shaded circles and glow rings
+        self.static_layer = StaticLayer(self.viewport.size, BLACK)  # Settled circles
+        self.dirty_rects = DirtyRectRenderer() if DIRTY_RECTS else None
+        self.profiler = FrameProfiler(profile_log)  # F3 toggles the timing overlay
+        self.quality = QualityGovernor(FRAME_BUDGET_MS, enabled=ADAPTIVE_QUALITY)
+        self.resources = RenderResources()  # Info font and text, built once
         
-        # Generate packed circles
-        self.generator = CirclePackingGenerator(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.circles = self.generator.generate_packed_circles()
-        self.current_circle_index = 0
+        # Generate packed circles. Progressive packing runs PACK_BUDGET_MS a
+        # frame so the window never freezes; exports pack everything up front
+        # so their frames don't depend on machine speed
+        self.image_path = image_path or GUIDE_IMAGE
+        self.generator = CirclePackingGenerator(SCREEN_WIDTH, SCREEN_HEIGHT, seed,
+                                                self._load_guide())
+        self.progressive = progressive
+        self.packing = None  # Packing steps still to run, when progressive
+        self.waiting = []  # Packed circles not yet growing, when progressive
+        self.reveal_rng = self.generator.rng.spawn(1)[0]  # Reveal order, apart from the packing stream
         self.animation_speed = 3  # Circles to grow per frame
-        
-        print(f"Generated {len(self.circles)} packed circles")
+        self._regenerate()
+        if self.packing is None:
+            print(f"Generated {len(self.circles)} packed circles")
+    
+    def _reset_layers(self):
+        """Mark every circle as animating (waiting, when progressive) again and drop the baked layer"""
+        if self.progressive:
+            self.animating = []
+            self.waiting = list(self.circles)
+        else:
+            self.animating = list(self.circles)
+        self.settled_pending = []
+        self.static_layer.clear()
+        self.sim_clock.reset()  # Don't replay the time spent regenerating
+        if self.dirty_rects:
+            self.dirty_rects.invalidate()
+    
+    def _load_guide(self):
+        """ImageGuide for image_path, or None to fill the whole canvas"""
+        if not self.image_path:
+            return None
+        try:
+            guide = ImageGuide(self.image_path, SCREEN_WIDTH, SCREEN_HEIGHT, MIN_RADIUS, MAX_RADIUS)
+        except Exception as e:
+            print(f"❌ Couldn't load {self.image_path}: {e} - filling the whole canvas")
+            return None
+        print(f"✅ Packing into {os.path.basename(self.image_path)}")
+        return guide
+    
+    def _regenerate(self):
+        """Pack a new set of circles with the engine selected by packing_mode"""
+        if self.progressive:
+            self.circles = []
+            if self.packing_mode == "distance_field":
+                self.packing = self.generator.pack_distance_field()
+            else:
+                self.packing = self.generator.pack_random()
+        elif self.packing_mode == "distance_field":
+            self.circles = self.generator.generate_distance_field_circles()
+        else:
+            self.circles = self.generator.generate_packed_circles()
+        self.current_circle_index = 0
+        self._reset_layers()
+    
+    def advance_packing(self, budget_ms=PACK_BUDGET_MS):
+        """Run packing steps for up to budget_ms; placed circles wait to be revealed"""
+        if self.packing is None:
+            return
+        deadline = time.perf_counter() + budget_ms / 1000
+        for circle in self.packing:
+            if circle is not None:
+                self.circles.append(circle)
+                self.waiting.append(circle)
+            if time.perf_counter() >= deadline:
+                return
+        self.packing = None
+        print(f"Packed {len(self.circles)} circles with {self.packing_mode} mode")
     
     def handle_events(self):
         """Handle user input events"""
         for event in pygame.event.get():
+            self.profiler.handle_event(event)
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -211,18 +435,28 @@ class PackedCircleArt:
                     self.running = False
                 elif event.key == pygame.K_SPACE:
                     # Regenerate circles
-                    self.circles = self.generator.generate_packed_circles()
-                    self.current_circle_index = 0
-                    print(f"Regenerated {len(self.circles)} packed circles")
+                    self._regenerate()
+                    if self.packing is None:
+                        print(f"Regenerated {len(self.circles)} packed circles")
+                elif event.key == pygame.K_m:
+                    # Switch packing engine and regenerate
+                    self.packing_mode = ("distance_field" if self.packing_mode == "random"
+                                         else "random")
+                    self._regenerate()
+                    if self.packing is None:
+                        print(f"Packed {len(self.circles)} circles with {self.packing_mode} mode")
                 elif event.key == pygame.K_i:
                     # Toggle info display
                     self.show_info = not self.show_info
+                    if self.dirty_rects:
+                        self.dirty_rects.invalidate()
                 elif event.key == pygame.K_r:
                     # Restart animation
                     for circle in self.circles:
                         circle.radius = 0
                         circle.is_growing = True
                     self.current_circle_index = 0
+                    self._reset_layers()
     
     def update(self):
         """Update circle animations"""
@@ -238,56 +472,145 @@ class PackedCircleArt:
             # Move to next batch
             self.current_circle_index += self.animation_speed
         
-        # Update all circles
-        for circle in self.circles:
+        if self.waiting:
+            # Start a share of the packed circles in random order, so growth
+            # spreads over the canvas instead of following the packing order
+            self.reveal_rng.shuffle(self.waiting)
+            count = max(self.animation_speed, int(len(self.waiting) * REVEAL_SHARE))
+            self.animating.extend(self.waiting[-count:])
+            del self.waiting[-count:]
+        self.profiler.mark('spawn')
+        
+        # Update circles still animating; settled ones wait to be baked
+        still_animating = []
+        for circle in self.animating:
             circle.update()
+            if circle.is_settled():
+                self.settled_pending.append(circle)
+            else:
+                still_animating.append(circle)
+        self.animating = still_animating
+        self.profiler.mark('update')
     
     def draw(self):
         """Render the packed circle art"""
-        self.screen.fill(BLACK)
+        # Composite newly settled circles once into the static layer, which
+        # then stands in for clearing the screen
+        if self.settled_pending:
+            baked = []
+            for circle in self.settled_pending:
+                baked.extend(circle.blit_items(self.sprites, viewport=self.viewport))
+            self.static_layer.bake(baked)
+            self.settled_pending = []
         
-        # Draw all circles
-        for circle in self.circles:
-            circle.draw(self.screen)
+        if self.dirty_rects:
+            # Restore only the regions drawn over last frame
+            self.dirty_rects.erase(self.screen, self.static_layer.surface)
+        else:
+            self.static_layer.draw(self.screen)
+        
+        # Draw circles still growing as one batch of pre-rendered sprites
+        items = []
+        quality = self.quality.settings
+        for circle in self.animating:
+            items.extend(circle.blit_items(self.sprites, quality, self.viewport))
+        rects = self.screen.blits(items, doreturn=self.dirty_rects is not None)
         
         # Draw info if enabled
         if self.show_info:
-            self._draw_info()
+            info_rects = self._draw_info()
+            if self.dirty_rects:
+                rects.extend(info_rects)
         
-        pygame.display.flip()
+        overlay_rect = self.profiler.draw_overlay(self.screen)
+        self.profiler.mark('draw')
+        if self.dirty_rects:
+            self.dirty_rects.present(rects + [overlay_rect])
+        else:
+            pygame.display.flip()
+        self.profiler.mark('present')
+    
+    def is_finished(self):
+        """True once every circle is packed, grown and baked"""
+        return (self.packing is None and self.current_circle_index >= len(self.circles) and
+                not self.waiting and not self.animating and not self.settled_pending)
+    
+    def profile_counts(self):
+        """Circle counts reported to the frame profiler (circles never move)"""
+        growing = sum(1 for circle in self.animating if circle.is_growing)
+        return {
+            'alive': len(self.circles),
+            'growing': growing,
+            'moving': 0,
+            'settled': len(self.circles) - len(self.animating) - len(self.waiting),
+            'allocations': self.resources.frame_allocations() + self.sprites.frame_allocations(),
+            'quality': self.quality.level,
+        }
     
     def _draw_info(self):
-        """Draw information overlay"""
-        font = pygame.font.Font(None, 36)
+        """Draw information overlay; returns the rects drawn"""
         info_texts = [
-            f"Circles: {len(self.circles)}",
+            f"Circles: {len(self.circles)}" + (" (packing)" if self.packing else ""),
             f"Growing: {self.current_circle_index}/{len(self.circles)}",
+            f"Mode: {self.packing_mode}" + (f" ({os.path.basename(self.image_path)})"
+                                            if self.generator.guide else ""),
             "Controls:",
             "SPACE - Regenerate",
+            "M - Switch packing mode",
             "R - Restart animation", 
             "I - Toggle info",
+            "F3 - Frame timings",
             "ESC - Exit"
         ]
         
+        scale = self.viewport.scale  # Text keeps its size relative to the output
+        rects = []
         for i, text in enumerate(info_texts):
-            color = WHITE if i < 2 else (200, 200, 200)
-            surface = font.render(text, True, color)
-            self.screen.blit(surface, (10, 10 + i * 30))
+            color = WHITE if i < 3 else (200, 200, 200)
+            surface = self.resources.label(i, text, round(36 * scale), color)
+            rects.append(self.screen.blit(surface, (round(10 * scale), round((10 + i * 30) * scale))))
+        return rects
     
     def run(self):
         """Main application loop"""
         while self.running:
+            self.profiler.begin_frame()
             self.handle_events()
-            self.update()
+            self.profiler.mark('events')
+            self.advance_packing()
+            self.profiler.mark('spawn')
+            for _ in range(self.sim_clock.tick()):
+                self.update()
             self.draw()
+            self.profiler.end_frame(**self.profile_counts())
+            if self.quality.record(self.profiler.last_work) and self.profiler.show_overlay:
+                print(f"⚙️ Quality level {self.quality.label}")
             self.clock.tick(FPS)
         
+        self.profiler.close()
         pygame.quit()
         sys.exit()
 
 def main():
     """Entry point for packed circle art application"""
-    app = PackedCircleArt()
+    parser = argparse.ArgumentParser(description="Packed Circle Art")
+    parser.add_argument("--image", metavar="PATH",
+                        help="pack circles into the shape and colors of an image (default: fill the canvas)")
+    add_export_arguments(parser)
+    add_profiler_arguments(parser)
+    args = parser.parse_args()
+    size = output_size(parser, args, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    if is_export(args):
+        # Headless offline render - no window, no frame limiter
+        exporter = prepare_export(args)
+        app = PackedCircleArt(seed=args.seed, output_size=size, image_path=args.image)
+        export_frames(app, exporter, args.frames)
+        pygame.quit()
+        return
+    
+    app = PackedCircleArt(profile_log=args.profile_log, output_size=size, progressive=True,
+                          image_path=args.image)
     app.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,210 @@
+"""
+Parallel Export - Multiprocess frame rendering for sphere animation exports
+The main process runs the deterministic simulation and writes each frame's
+sphere state into shared memory; a process pool rasterizes and PNG-encodes the
+frames independently at the app's output size and results are collected in
+frame order.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+CHUNK_FRAMES = 60  # Frames simulated into one shared state buffer
+STATE_FIELDS = 5   # x, y, radius, is_growing, settle rank (-1 while in flight) per sphere
+BLACK = (0, 0, 0)
+
+# Per-worker state, set up by _init_worker
+_worker = {}
+
+
+def add_parallel_arguments(parser):
+    """Add the parallel export options to an app's argument parser"""
+    group = parser.add_argument_group("parallel export")
+    group.add_argument("--workers", type=int, default=1,
+                       help="render exported frames in this many processes (default: 1)")
+
+
+def _init_worker(state_names, state_shape, color_name, color_shape, layout_size, output_size,
+                 output_dir):
+    """Attach to the shared buffers once per worker process"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    import pygame
+    from sprite_cache import SpriteCache
+    from viewport import Viewport
+
+    buffers = []
+    for name in state_names:
+        shm = shared_memory.SharedMemory(name=name)
+        buffers.append((shm, np.ndarray(state_shape, dtype=np.float64, buffer=shm.buf)))
+    color_shm = shared_memory.SharedMemory(name=color_name)
+    viewport = Viewport(layout_size, output_size)
+
+    _worker.update(
+        pygame=pygame,
+        buffers=buffers,
+        color_shm=color_shm,
+        colors=np.ndarray(color_shape, dtype=np.uint8, buffer=color_shm.buf),
+        surface=pygame.Surface(output_size),
+        viewport=viewport,
+        sprites=SpriteCache(scale=viewport.scale),
+        output_dir=output_dir,
+    )
+
+
+def _render_frame(task):
+    """Rasterize one frame from shared state; returns its PNG path or RGB bytes"""
+    frame, buffer_index, slot, count = task
+    from sprite_cache import EFFECT_SPHERE, EFFECT_SPHERE_GLOW
+
+    pygame = _worker["pygame"]
+    surface = _worker["surface"]
+    sprites = _worker["sprites"]
+    viewport = _worker["viewport"]
+    state = _worker["buffers"][buffer_index][1][slot, :count]
+
+    # Draw in the serial export's order: settled spheres as its static layer
+    # baked them, in settle order, then the spheres still in flight by index
+    rank = state[:, 4]
+    settled = np.flatnonzero(rank >= 0)
+    order = np.concatenate((settled[np.argsort(rank[settled], kind='stable')],
+                            np.flatnonzero(rank < 0)))
+    state = state[order]
+
+    xs, ys = viewport.points(state[:, 0], state[:, 1])
+    radii = viewport.lengths(state[:, 2])
+    growing = state[:, 3] > 0
+
+    items = []
+    for x, y, radius, color, is_growing in zip(xs.tolist(), ys.tolist(), radii.tolist(),
+                                               _worker["colors"][order].tolist(),
+                                               growing.tolist()):
+        if radius > 0:
+            effect = EFFECT_SPHERE_GLOW if is_growing else EFFECT_SPHERE
+            items.append(sprites.blit_item(x, y, radius, tuple(color), effect))
+
+    surface.fill(BLACK)
+    surface.blits(items, doreturn=False)
+
+    if _worker["output_dir"] is None:
+        return pygame.image.tobytes(surface, "RGB")
+    path = os.path.join(_worker["output_dir"], f"frame_{frame:06d}.png")
+    pygame.image.save(surface, path)
+    return path
+
+
+def export_parallel(app, output_dir=None, stream=None, frames=None, workers=None,
+                    chunk_frames=CHUNK_FRAMES):
+    """Export an AutoSphereArt animation with rasterization spread over a process pool
+
+    While the pool renders one chunk of frames, the next chunk is simulated
+    into a second shared buffer, so simulation and rendering overlap.
+    """
+    workers = workers or os.cpu_count()
+    viewport = app.viewport
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    # Spheres are created in queue order, so store index i gets queue color i
+    queue = app.sphere_creator.dot_queue
+    sphere_count = max(1, queue.total)
+    state_shape = (chunk_frames, sphere_count, STATE_FIELDS)
+    color_shape = (sphere_count, 3)
+
+    state_shms = [shared_memory.SharedMemory(create=True, size=int(np.prod(state_shape)) * 8)
+                  for _ in range(2)]
+    color_shm = shared_memory.SharedMemory(create=True, size=int(np.prod(color_shape)))
+    states = [np.ndarray(state_shape, dtype=np.float64, buffer=shm.buf) for shm in state_shms]
+    colors = np.ndarray(color_shape, dtype=np.uint8, buffer=color_shm.buf)
+    colors[:queue.total] = queue.dots['color']
+    settle_rank = np.full(sphere_count, -1.0)  # Order spheres settle in, like the static layer bakes
+
+    start = time.perf_counter()
+    frame = 0
+    pending = []  # (frame count, AsyncResult) per chunk, in frame order
+    finished = False
+    try:
+        pool = multiprocessing.Pool(
+            workers, initializer=_init_worker,
+            initargs=([shm.name for shm in state_shms], state_shape,
+                      color_shm.name, color_shape, viewport.layout_size, viewport.size,
+                      output_dir))
+        try:
+            buffer_index = 0
+            while not finished or pending:
+                if not finished:
+                    # A buffer can only be refilled once its frames are rendered
+                    if len(pending) == 2:
+                        frame = _collect(pending.pop(0), stream, frame, start)
+                    tasks = _simulate_chunk(app, states[buffer_index], buffer_index, settle_rank,
+                                            chunk_frames, frame + _queued_frames(pending), frames)
+                    finished = len(tasks) < chunk_frames or (
+                        frames is None and app.is_finished())
+                    if tasks:
+                        pending.append((len(tasks), pool.map_async(_render_frame, tasks)))
+                    buffer_index = 1 - buffer_index
+                else:
+                    frame = _collect(pending.pop(0), stream, frame, start)
+        finally:
+            # Pool.terminate would hang: SDL turns SIGTERM into a quit event in workers
+            pool.close()
+            pool.join()
+    finally:
+        for shm in state_shms + [color_shm]:
+            shm.close()
+            shm.unlink()
+
+    if stream is not None:
+        stream.flush()
+    elapsed = time.perf_counter() - start
+    print(f"✅ Exported {frame} frames in {elapsed:.1f}s with {workers} workers", file=sys.stderr)
+    return frame
+
+
+def _queued_frames(pending):
+    return sum(count for count, _ in pending)
+
+
+def _simulate_chunk(app, state, buffer_index, settle_rank, chunk_frames, first_frame, frames):
+    """Advance the simulation, snapshotting sphere state per frame into a buffer"""
+    store = app.sphere_store
+    ranked = int((settle_rank >= 0).sum())
+    tasks = []
+    for slot in range(chunk_frames):
+        frame = first_frame + slot
+        if frames is not None and frame >= frames:
+            break
+        if frames is None and frame > 0 and app.is_finished():
+            break
+
+        app.update()
+        # Nothing draws here, so take the settled spheres the app queued for
+        # baking and rank them instead
+        for settled in app.settled_pending:
+            settle_rank[settled] = np.arange(ranked, ranked + len(settled))
+            ranked += len(settled)
+        app.settled_pending.clear()
+        count = store.count
+        state[slot, :count, 0] = store.x[:count]
+        state[slot, :count, 1] = store.y[:count]
+        state[slot, :count, 2] = store.radius[:count]
+        state[slot, :count, 3] = store.is_growing[:count]
+        state[slot, :count, 4] = settle_rank[:count]
+        tasks.append((frame, buffer_index, slot, count))
+    return tasks
+
+
+def _collect(entry, stream, frame, start):
+    """Wait for one chunk of rendered frames and emit them in order"""
+    count, result = entry
+    for output in result.get():
+        if stream is not None:
+            stream.write(output)
+    frame += count
+    elapsed = time.perf_counter() - start
+    print(f"🎞️ {frame} frames ({frame / elapsed:.1f} fps)", file=sys.stderr)
+    return frame
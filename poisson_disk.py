@@ -0,0 +1,108 @@
+"""
+Poisson Disk - Blue-noise sphere placement with a variable minimum distance
+Bridson's algorithm grown out from seed points: each accepted point throws a
+batch of candidates into the annulus around it, and a candidate is kept only
+if it stays clear of every neighbour by the sum of their radii (scaled by the
+allowed overlap). A background grid with at most one point per cell limits
+each check to a small window of cells, so generation is linear in the number
+of points.
+"""
+
+import math
+
+import numpy as np
+
+CANDIDATES = 16  # Candidates thrown around a point before it stops spawning
+
+
+def poisson_disk_samples(radius_map, overlap, rng, candidates=CANDIDATES):
+    """Blue-noise points over the area where radius_map is positive
+
+    radius_map gives the sphere radius wanted at each pixel (0 = background).
+    Two points i and j are kept at least overlap * (r_i + r_j) apart. Returns
+    float x and y arrays and the radius of each point.
+    """
+    height, width = radius_map.shape
+    foreground = radius_map > 0
+    if not foreground.any():
+        return np.empty(0), np.empty(0), np.empty(0)
+    r_min = float(radius_map[foreground].min())
+    r_max = float(radius_map.max())
+
+    # Cells smaller than the closest allowed spacing over sqrt(2) hold one point each
+    cell = overlap * 2 * r_min / math.sqrt(2)
+    grid = np.full((int(height / cell) + 1, int(width / cell) + 1), -1, dtype=np.int64)
+    xs, ys, radii = [], [], []  # Accepted points, for scalar access
+    points = [np.empty(1024), np.empty(1024), np.empty(1024)]  # The same as arrays, for vectorized checks
+
+    def neighbours(x, y, reach):
+        """Indices of accepted points in the cells within reach of (x, y)"""
+        x0, x1 = max(int((x - reach) / cell), 0), int((x + reach) / cell) + 1
+        y0, y1 = max(int((y - reach) / cell), 0), int((y + reach) / cell) + 1
+        window = grid[y0:y1, x0:x1]
+        return window[window >= 0]
+
+    def clear(cx, cy, cr, reach, x, y):
+        """Mask of candidates no closer to an accepted point than their spacing allows"""
+        near = neighbours(x, y, reach)
+        if not len(near):
+            return np.ones(len(cx), dtype=bool)
+        px, py, pr = points[0][near], points[1][near], points[2][near]
+        gap = np.hypot(cx[:, None] - px[None, :], cy[:, None] - py[None, :])
+        return (gap >= overlap * (cr[:, None] + pr[None, :])).all(axis=1)
+
+    def accept(x, y, r):
+        index = len(xs)
+        if index == len(points[0]):
+            for array in range(3):
+                points[array] = np.resize(points[array], 2 * index)
+        points[0][index], points[1][index], points[2][index] = x, y, r
+        xs.append(x)
+        ys.append(y)
+        radii.append(r)
+        grid[int(y / cell), int(x / cell)] = index
+        return index
+
+    # Every region gets a chance to start growing, so separate shapes
+    # (letters of a logo) are all covered; seeds inside covered areas fail
+    stride = max(1, int(overlap * 2 * r_min))
+    seed_y, seed_x = np.nonzero(foreground[::stride, ::stride])
+    order = rng.permutation(len(seed_x))
+    seed_x = seed_x[order] * stride + 0.5
+    seed_y = seed_y[order] * stride + 0.5
+
+    for sx, sy in zip(seed_x.tolist(), seed_y.tolist()):
+        sr = float(radius_map[int(sy), int(sx)])
+        if not clear(np.array([sx]), np.array([sy]), np.array([sr]), overlap * (sr + r_max), sx, sy)[0]:
+            continue
+        active = [accept(sx, sy, sr)]
+        while active:
+            slot = int(rng.integers(len(active)))
+            index = active[slot]
+            x, y, r = xs[index], ys[index], radii[index]
+
+            # Candidates in the annulus between one and two spacings away
+            spacing = overlap * 2 * r
+            angle = rng.random(candidates) * (2 * math.pi)
+            distance = spacing * (1 + rng.random(candidates))
+            cx = x + distance * np.cos(angle)
+            cy = y + distance * np.sin(angle)
+            inside = (cx >= 0) & (cx < width) & (cy >= 0) & (cy < height)
+            cx, cy = cx[inside], cy[inside]
+            cr = radius_map[cy.astype(np.int64), cx.astype(np.int64)]
+            on_art = cr > 0
+            cx, cy, cr = cx[on_art], cy[on_art], cr[on_art]
+
+            found = False
+            if len(cx):
+                ok = clear(cx, cy, cr, 2 * spacing + overlap * (r_max + r_max), x, y)
+                if ok.any():
+                    first = int(np.argmax(ok))
+                    active.append(accept(float(cx[first]), float(cy[first]), float(cr[first])))
+                    found = True
+            if not found:
+                # Retire the point: swap-remove keeps this O(1)
+                active[slot] = active[-1]
+                active.pop()
+
+    return np.array(xs), np.array(ys), np.array(radii)
@@ -0,0 +1,97 @@
+"""
+Quality Governor - Trades visual extras for frame time under load
+Watches recent frame work times against a budget and steps through quality
+levels (glow, gradients, trails, small outlines). It degrades quickly when
+frames run over budget and restores quality only after sustained headroom,
+backing off further each time a restore has to be undone. Recent frames are
+kept as running counts, so judging a frame allocates nothing.
+"""
+
+from collections import deque
+
+# Cumulative quality levels, best first; apps read the settings they use
+QUALITY_LEVELS = [
+    {'name': 'full', 'glow': True, 'gradient': True, 'trail_scale': 1.0, 'outline_min_radius': 0},
+    {'name': 'no glow', 'glow': False, 'gradient': True, 'trail_scale': 1.0, 'outline_min_radius': 0},
+    {'name': 'flat', 'glow': False, 'gradient': False, 'trail_scale': 1.0, 'outline_min_radius': 0},
+    {'name': 'short trails', 'glow': False, 'gradient': False, 'trail_scale': 0.5,
+     'outline_min_radius': 0},
+    {'name': 'no small outlines', 'glow': False, 'gradient': False, 'trail_scale': 0.5,
+     'outline_min_radius': 8},
+    {'name': 'minimal', 'glow': False, 'gradient': False, 'trail_scale': 0.2,
+     'outline_min_radius': 12},
+]
+
+DEGRADE_FRAMES = 8      # Most of this many frames over budget drops a level
+RESTORE_FRAMES = 90     # Frames that must all fit the restore budget to raise a level
+RESTORE_HEADROOM = 0.7  # Restore only when frames use under this share of the budget
+HOLD_FRAMES = 15        # Frames to wait after any change before judging again
+MAX_RESTORE_FRAMES = 1200
+
+
+class QualityGovernor:
+    """Picks a quality level from recent frame work times"""
+
+    def __init__(self, budget_ms, levels=QUALITY_LEVELS, enabled=True):
+        self.budget_ms = budget_ms
+        self.levels = levels
+        self.enabled = enabled
+        self.level = 0
+        self.recent_over = deque(maxlen=DEGRADE_FRAMES)  # Over budget, per recent frame
+        self.over_count = 0     # True entries in recent_over
+        self.calm_frames = 0    # Consecutive frames within the restore budget
+        self.level_frames = 0   # Frames judged at the current level
+        self.restore_frames = RESTORE_FRAMES
+        self._hold = 0
+        self._restored = False  # Last change was a restore; a quick drop means it was premature
+
+    @property
+    def settings(self):
+        return self.levels[self.level]
+
+    @property
+    def label(self):
+        return f"{self.level}: {self.settings['name']}"
+
+    def record(self, work_ms):
+        """Feed one frame's work time; returns True if the quality level changed"""
+        if not self.enabled:
+            return False
+        over = work_ms > self.budget_ms
+        if len(self.recent_over) == DEGRADE_FRAMES:
+            self.over_count -= self.recent_over[0]
+        self.recent_over.append(over)
+        self.over_count += over
+        self.calm_frames = self.calm_frames + 1 if work_ms < self.budget_ms * RESTORE_HEADROOM else 0
+        self.level_frames += 1
+        if self._hold > 0:
+            self._hold -= 1
+            return False
+
+        if (len(self.recent_over) == DEGRADE_FRAMES and self.level < len(self.levels) - 1 and
+                self.over_count * 2 > DEGRADE_FRAMES):
+            if self._restored:
+                # The last restore didn't hold - wait longer before the next one
+                self.restore_frames = min(self.restore_frames * 2, MAX_RESTORE_FRAMES)
+            self._change(self.level + 1, restored=False)
+            return True
+
+        if self.level > 0 and self.calm_frames >= self.restore_frames:
+            self._change(self.level - 1, restored=True)
+            return True
+
+        if self._restored and self.level_frames >= self.restore_frames:
+            # The restored level has held for a full period - forget the backoff
+            self._restored = False
+            self.restore_frames = RESTORE_FRAMES
+        return False
+
+    def _change(self, level, restored):
+        self.level = level
+        self._restored = restored
+        self._hold = HOLD_FRAMES
+        # Judge the new level only on its own frames
+        self.recent_over.clear()
+        self.over_count = 0
+        self.calm_frames = 0
+        self.level_frames = 0
@@ -0,0 +1,60 @@
+"""
+Render Resources - Fonts, overlay surfaces and text created once per app
+Draw code asks for a font, a translucent fill surface or a text label every
+frame; each is built on first use and reused afterwards. Labels re-render only
+when their text changes, and every creation is counted so a steady-state
+frame can be checked to allocate nothing.
+"""
+
+import pygame
+
+BLACK = (0, 0, 0)
+
+
+class RenderResources:
+    """Per-app cache of fonts, fill surfaces and rendered text labels"""
+
+    def __init__(self):
+        self.fonts = {}     # size -> Font
+        self.surfaces = {}  # (size, color, alpha) -> Surface
+        self.labels = {}    # key -> (text, color, Surface)
+        self.allocations = 0  # Resources created in total
+        self._frame_start = 0
+
+    def font(self, size):
+        """The default font at a point size"""
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+            self.allocations += 1
+        return font
+
+    def fill_surface(self, size, color=BLACK, alpha=None):
+        """A surface of one color, e.g. a translucent full-screen fade"""
+        key = (size, color, alpha)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            if alpha is not None:
+                surface.set_alpha(alpha)
+            self.surfaces[key] = surface
+            self.allocations += 1
+        return surface
+
+    def label(self, key, text, size, color):
+        """Rendered text for a HUD slot, re-rendered only when text or color change"""
+        cached = self.labels.get(key)
+        if cached is not None and cached[0] == text and cached[1] == color:
+            return cached[2]
+        surface = self.font(size).render(text, True, color)
+        self.labels[key] = (text, color, surface)
+        self.allocations += 1
+        return surface
+
+    def frame_allocations(self):
+        """Resources created since the last call - zero in a steady-state frame"""
+        count = self.allocations - self._frame_start
+        self._frame_start = self.allocations
+        return count
@@ -0,0 +1,51 @@
+"""
+Sim Clock - Fixed-timestep simulation clock
+Accumulates wall-clock time and tells the app how many fixed simulation steps
+to run each rendered frame, so animations take the same real time whatever the
+render rate. The leftover fraction of a step is exposed for interpolation.
+"""
+
+import time
+
+MAX_STEPS_PER_FRAME = 8  # Beyond this the simulation slows down rather than spiralling
+
+
+class SimClock:
+    """Accumulator that converts elapsed real time into fixed simulation steps"""
+
+    def __init__(self, step_rate, max_steps=MAX_STEPS_PER_FRAME):
+        self.step_time = 1.0 / step_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.steps = 0  # Total steps run since the last reset
+        self._last = None
+
+    def reset(self):
+        """Restart timing, e.g. after a restart or a long pause"""
+        self.accumulator = 0.0
+        self.steps = 0
+        self._last = None
+
+    def tick(self):
+        """Number of steps due since the last tick (at least one on the first call)"""
+        now = time.perf_counter()
+        if self._last is None:
+            self._last = now
+            self.accumulator = self.step_time
+        else:
+            self.accumulator += now - self._last
+            self._last = now
+
+        steps = int(self.accumulator / self.step_time)
+        if steps > self.max_steps:
+            # Too far behind to catch up - drop the backlog instead of stalling
+            steps = self.max_steps
+            self.accumulator = steps * self.step_time
+        self.accumulator -= steps * self.step_time
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """How far (0..1) real time has moved past the last step toward the next"""
+        return min(1.0, self.accumulator / self.step_time)
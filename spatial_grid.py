@@ -0,0 +1,90 @@
+"""
+Spatial Grid - Uniform spatial hash for fast circle overlap queries
+Circles are bucketed by the cell containing their center, so a query only
+visits the cells that can hold an overlapping neighbour.
+"""
+
+import math
+
+
+class SpatialHashGrid:
+    """Spatial hash of circles keyed by integer cell coordinates"""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.max_radius = 0  # Largest radius inserted, bounds the search reach
+        self.count = 0
+
+    def clear(self):
+        """Remove all circles from the grid"""
+        self.cells = {}
+        self.max_radius = 0
+        self.count = 0
+
+    def insert(self, x, y, radius):
+        """Add a circle to the grid"""
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [(x, y, radius)]
+        else:
+            bucket.append((x, y, radius))
+        if radius > self.max_radius:
+            self.max_radius = radius
+        self.count += 1
+
+    def collides(self, x, y, radius, padding=0):
+        """Check if a circle comes closer than padding to any stored circle"""
+        cell_size = self.cell_size
+        reach = radius + self.max_radius + padding
+        min_cx = int((x - reach) // cell_size)
+        max_cx = int((x + reach) // cell_size)
+        min_cy = int((y - reach) // cell_size)
+        max_cy = int((y + reach) // cell_size)
+
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for other_x, other_y, other_radius in bucket:
+                    # Compare squared distances to avoid a sqrt per neighbour
+                    limit = radius + other_radius + padding
+                    dx = x - other_x
+                    dy = y - other_y
+                    if dx*dx + dy*dy < limit*limit:
+                        return True
+        return False
+
+    def free_radius(self, x, y, limit, padding=0, minimum=0):
+        """Largest radius up to limit that a circle at (x, y) can take without colliding
+
+        Returns early with a value below minimum as soon as one is found.
+        """
+        cell_size = self.cell_size
+        reach = limit + self.max_radius + padding
+        min_cx = int((x - reach) // cell_size)
+        max_cx = int((x + reach) // cell_size)
+        min_cy = int((y - reach) // cell_size)
+        max_cy = int((y + reach) // cell_size)
+
+        best = limit
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for other_x, other_y, other_radius in bucket:
+                    # Only neighbours closer than the current best need a sqrt
+                    edge = best + other_radius + padding
+                    dx = x - other_x
+                    dy = y - other_y
+                    distance_sq = dx*dx + dy*dy
+                    if distance_sq < edge*edge:
+                        best = math.sqrt(distance_sq) - other_radius - padding
+                        if best < minimum:
+                            return best
+        return best
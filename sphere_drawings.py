@@ -4,12 +4,25 @@ A physics simulation that creates artistic sphere drawings using Pygame.
 """
 
 import pygame
+import argparse
 import math
 import random
 import sys
 import os
 import numpy as np
-from PIL import Image
+from sprite_cache import SpriteCache, default_cache, EFFECT_DISC, EFFECT_SPHERE, EFFECT_SPHERE_GLOW
+from dirty_rects import DirtyRectRenderer
+from dot_queue import DotQueue
+from trail_buffer import TrailBuffer
+from render_resources import RenderResources
+from image_loader import load_fitted
+from poisson_disk import poisson_disk_samples
+from offline_render import add_export_arguments, is_export, prepare_export, export_frames, output_size
+from frame_profiler import FrameProfiler, add_profiler_arguments
+from sim_clock import SimClock
+from quality_governor import QualityGovernor
+from timeline import Timeline, Playhead
+from viewport import Viewport, IDENTITY
 
 # Initialize Pygame
 pygame.init()
@@ -17,7 +30,19 @@ pygame.init()
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # Render frame cap; 0 renders uncapped
+SIM_RATE = 60  # Fixed simulation steps per second - animation speeds are per step
+ADAPTIVE_QUALITY = True  # Shorten trails and drop glow and small outlines when frames run over budget
+FRAME_BUDGET_MS = 1000 / 60
+DIRTY_RECTS = False  # Present only changed regions when trails don't persist
+TRAIL_MODE = "classic"  # "classic" redraws every trail point; "accumulate" fades a trail layer
+TRAIL_LENGTH = 50  # Positions kept per sphere trail
+TRAIL_FADE = 0.94  # Accumulated trail brightness kept per frame
+SPHERE_GROWTH_SPEED = 1.5  # Faster growth for quick appearance
+SPHERE_MOVE_SPEED = 0.1  # Speed of movement to target position
+ALPHA_CUTOFF = 32  # Pixels less opaque than this are background (resizing smears transparent edges)
+SAMPLING_MODE = "grid"  # "grid" samples every 8 pixels, "poisson" scatters evenly spaced blue noise
+POISSON_OVERLAP = 0.6  # Poisson dots keep this share of their radius sum apart
 GRAVITY = 0.5
 FRICTION = 0.99
 BOUNCE_DAMPENING = 0.8
@@ -38,60 +63,18 @@ COLORS = [RED, GREEN, BLUE, YELLOW, PURPLE, CYAN, ORANGE]
 class ProgressiveDotCreator:
     """Creates dots progressively from image pattern with appearing animation"""
     def __init__(self):
-        self.dot_queue = []
+        self.dot_queue = DotQueue()
         self.is_active = False
         self.dots_per_frame = 1  # ONLY 1 sphere per frame for true one-by-one
         self.frame_counter = 0
         self.creation_delay = 3  # 3 frames between each sphere for visible separation
         self.spawn_delay_counter = 0
+        self.timeline_start = 0  # Queue position the current timeline starts from
         
     def load_pattern(self, image_path):
         """Load image and create dot pattern data"""
         try:
-            img = Image.open(image_path)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Scale image to fit screen
-            img_width, img_height = img.size
-            scale = min(SCREEN_WIDTH/img_width, SCREEN_HEIGHT/img_height) * 0.7
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Calculate offset to center
-            offset_x = (SCREEN_WIDTH - new_width) // 2
-            offset_y = (SCREEN_HEIGHT - new_height) // 2
-            
-            img_array = np.array(img)
-            self.dot_queue = []
-            
-            # Sample every 8 pixels for dot pattern
-            for y in range(0, new_height, 8):
-                for x in range(0, new_width, 8):
-                    r, g, b = img_array[y, x]
-                    
-                    # Skip white/light background
-                    if (r + g + b) / 3 > 240:
-                        continue
-                    
-                    screen_x = x + offset_x + random.randint(-2, 2)
-                    screen_y = y + offset_y + random.randint(-2, 2)
-                    
-                    # Ensure within bounds
-                    screen_x = max(10, min(SCREEN_WIDTH - 10, screen_x))
-                    screen_y = max(10, min(SCREEN_HEIGHT - 10, screen_y))
-                    
-                    dot_info = {
-                        'x': screen_x,
-                        'y': screen_y,
-                        'color': (r, g, b),
-                        'radius': random.randint(4, 8)
-                    }
-                    self.dot_queue.append(dot_info)
-            
-            # Shuffle for random creation order
-            random.shuffle(self.dot_queue)
+            self.extract_pattern(image_path)
             print(f"🎯 Loaded {len(self.dot_queue)} dots for progressive creation")
             return True
             
@@ -99,6 +82,55 @@ class ProgressiveDotCreator:
             print(f"Error loading pattern: {e}")
             return False
     
+    def extract_pattern(self, image_path):
+        """Fill the dot queue from image_path, raising if the image can't be used"""
+        # Scale image to fit screen, reducing large sources while decoding
+        img = load_fitted(image_path, (SCREEN_WIDTH, SCREEN_HEIGHT), 0.7, 'RGBA')
+        new_width, new_height = img.size
+        
+        # Calculate offset to center
+        offset_x = (SCREEN_WIDTH - new_width) // 2
+        offset_y = (SCREEN_HEIGHT - new_height) // 2
+        
+        img_array = np.array(img)
+        dots_x, dots_y, colors, radii = [], [], [], []
+        
+        # Sample every 8 pixels for dot pattern, or at blue-noise points
+        # spaced for the average dot
+        if SAMPLING_MODE == "poisson":
+            brightness = img_array[..., :3].sum(axis=2, dtype=np.int32) / 3
+            radius_map = np.where((img_array[..., 3] >= ALPHA_CUTOFF) & (brightness <= 240), 6.0, 0.0)
+            rng = np.random.default_rng(random.getrandbits(32))
+            px, py, _ = poisson_disk_samples(radius_map, POISSON_OVERLAP, rng)
+            points = zip(py.astype(int).tolist(), px.astype(int).tolist())
+        else:
+            points = ((y, x) for y in range(0, new_height, 8) for x in range(0, new_width, 8))
+        for y, x in points:
+            r, g, b, a = img_array[y, x]
+            
+            # Skip transparent and white/light background
+            if a < ALPHA_CUTOFF or (int(r) + int(g) + int(b)) / 3 > 240:
+                continue
+            
+            screen_x = x + offset_x + random.randint(-2, 2)
+            screen_y = y + offset_y + random.randint(-2, 2)
+            
+            # Ensure within bounds
+            screen_x = max(10, min(SCREEN_WIDTH - 10, screen_x))
+            screen_y = max(10, min(SCREEN_HEIGHT - 10, screen_y))
+            
+            dots_x.append(screen_x)
+            dots_y.append(screen_y)
+            colors.append((r, g, b))
+            radii.append(random.randint(4, 8))
+        
+        # Shuffle for random creation order
+        order = list(range(len(dots_x)))
+        random.shuffle(order)
+        self.dot_queue = DotQueue(np.array(dots_x, dtype=int)[order], np.array(dots_y, dtype=int)[order],
+                                  np.array(colors, dtype=np.uint8).reshape(-1, 3)[order],
+                                  np.array(radii, dtype=int)[order])
+    
     def start_creation(self, speed=3):
         """Start one-by-one sphere creation"""
         self.is_active = True
@@ -112,18 +144,14 @@ class ProgressiveDotCreator:
     def get_next_dots(self):
         """Get next single dot to create - TRUE one by one"""
         if not self.is_active or not self.dot_queue:
-            return []
+            return self.dot_queue.take(0)
         
         self.frame_counter += 1
         if self.frame_counter >= self.creation_delay:
             self.frame_counter = 0
             
             # Get ONLY ONE dot at a time
-            next_dots = []
-            if self.dot_queue:
-                dot_data = self.dot_queue.pop(0)
-                dot_data['spawn_delay'] = 0  # No delay, immediate appearance
-                next_dots.append(dot_data)
+            next_dots = self.dot_queue.take(self.dots_per_frame)
             
             # Check if finished
             if not self.dot_queue:
@@ -132,16 +160,31 @@ class ProgressiveDotCreator:
             
             return next_dots
         
-        return []
+        return self.dot_queue.take(0)
     
     def is_creating(self):
         return self.is_active
     
     def remaining_count(self):
         return len(self.dot_queue)
+    
+    def timeline(self):
+        """Closed-form timeline of the dots still to be created"""
+        self.timeline_start = self.dot_queue.cursor
+        dots = self.dot_queue.dots[self.timeline_start:]
+        return Timeline(dots['x'], dots['y'], dots['radius'], dots['color'],
+                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                        SPHERE_GROWTH_SPEED, SPHERE_MOVE_SPEED,
+                        self.creation_delay, self.dots_per_frame)
+    
+    def seek(self, updates, spawned):
+        """Resume creation as it stands after the given number of updates"""
+        self.dot_queue.cursor = self.timeline_start + spawned
+        self.frame_counter = updates % self.creation_delay
+        self.is_active = bool(self.dot_queue)
 
 class Sphere:
-    def __init__(self, x, y, radius, color, velocity_x=0, velocity_y=0):
+    def __init__(self, x, y, radius, color, velocity_x=0, velocity_y=0, trails=None):
         self.target_x = x  # Final destination position
         self.target_y = y
         self.x = SCREEN_WIDTH // 2  # Start from center
@@ -151,13 +194,17 @@ class Sphere:
         self.color = color
         self.velocity_x = 0  # Will be calculated to reach target
         self.velocity_y = 0
-        self.trail = []  # Store previous positions for trail effect
-        self.max_trail_length = 50
+        # Previous positions for the trail effect live in a shared ring buffer
+        self.own_trails = trails is None
+        self.trails = TrailBuffer(TRAIL_LENGTH, capacity=1) if self.own_trails else trails
+        self.trail_slot = self.trails.allocate()
+        self.max_trail_length = self.trails.max_length
+        self.last_trail_point = None  # Where the accumulated trail was last drawn to
         self.is_growing = True
-        self.growth_speed = 1.5  # Faster growth for quick appearance
+        self.growth_speed = SPHERE_GROWTH_SPEED
         self.spawn_delay = 0  # Delay before starting to grow
         self.is_moving_to_target = False
-        self.move_speed = 0.1  # Speed of movement to target position
+        self.move_speed = SPHERE_MOVE_SPEED
         
     def update(self):
         # Handle sphere growth animation (appearing effect)
@@ -193,69 +240,141 @@ class Sphere:
         self.x += self.velocity_x
         self.y += self.velocity_y
         
-        # Store position for trail (only when visible)
-        if self.radius > 0:
-            self.trail.append((int(self.x), int(self.y)))
-            if len(self.trail) > self.max_trail_length:
-                self.trail.pop(0)
+        # Store position for trail (only when visible); spheres sharing a
+        # buffer are recorded all at once by record_trails instead
+        if self.radius > 0 and self.own_trails:
+            self.trails.push(self.trail_slot, int(self.x), int(self.y))
+    
+    @property
+    def trail(self):
+        """Trail positions, oldest first"""
+        return [tuple(pos) for pos in self.trails.ordered(self.trail_slot).tolist()]
+    
+    def is_static(self):
+        """True once the sphere has settled and its trail has collapsed onto it"""
+        return (not self.is_growing and not self.is_moving_to_target and
+                self.trails.length(self.trail_slot) == self.max_trail_length and
+                self.trails.oldest(self.trail_slot) == (int(self.x), int(self.y)))
     
-    def draw(self, screen):
+    def bounds(self, viewport=IDENTITY):
+        """Screen rect covering the trail, the sphere and its glow ring"""
+        trail = self.trails.ordered(self.trail_slot)
+        xs, ys = viewport.points(trail[:, 0], trail[:, 1])
+        x, y = viewport.point(self.x, self.y)
+        xs = xs.tolist() + [x]
+        ys = ys.tolist() + [y]
+        reach = viewport.length(self.radius + 3) + 1  # Glow ring plus one pixel of rasterization
+        return pygame.Rect(min(xs) - reach, min(ys) - reach,
+                           max(xs) - min(xs) + 2 * reach + 1, max(ys) - min(ys) + 2 * reach + 1)
+    
+    def draw_trail_segment(self, layer, viewport=IDENTITY):
+        """Extend the accumulated trail from where it was last drawn to the newest point"""
+        newest = self.trails.latest(self.trail_slot)
+        if newest is None:
+            return
+        newest = viewport.point(*newest)
+        trail_radius = max(1, viewport.length(self.radius * 0.5))
+        start = self.last_trail_point or newest
+        if start != newest:
+            pygame.draw.line(layer, self.color, start, newest, 2 * trail_radius)
+        pygame.draw.circle(layer, self.color, newest, trail_radius)
+        self.last_trail_point = newest
+    
+    def draw_trail(self, screen, quality=None, viewport=IDENTITY):
+        """Draw the trail - reduced quality keeps only its newest, brightest part"""
         # Only draw if sphere has some size
         if self.radius <= 0:
             return
-            
-        # Draw trail
-        for i, pos in enumerate(self.trail):
-            alpha = i / len(self.trail)  # Fade effect
-            trail_radius = max(1, int(self.radius * alpha * 0.5))
+        positions = self.trails.ordered(self.trail_slot)
+        xs, ys = viewport.points(positions[:, 0], positions[:, 1])
+        points = list(zip(xs.tolist(), ys.tolist()))
+        skip = 0
+        if quality is not None:
+            skip = len(points) - int(len(points) * quality['trail_scale'])
+        for i, pos in enumerate(points[skip:], skip):
+            alpha = i / len(points)  # Fade effect
+            trail_radius = max(1, viewport.length(self.radius * alpha * 0.5))
             trail_color = tuple(int(c * alpha) for c in self.color)
             pygame.draw.circle(screen, trail_color, pos, trail_radius)
-        
-        # Draw main sphere with growing effect
-        current_radius = int(self.radius)
-        if current_radius > 0:
-            # Add a subtle glow effect during growth
-            if self.is_growing:
-                # Outer glow
-                glow_radius = current_radius + 3
-                glow_color = tuple(min(255, c + 50) for c in self.color)
-                pygame.draw.circle(screen, glow_color, (int(self.x), int(self.y)), glow_radius, 2)
-            
-            # Main sphere
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), current_radius)
-            pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), current_radius, 2)
+    
+    def blit_item(self, sprites=default_cache, quality=None, viewport=IDENTITY):
+        """(sprite, position) for the main sphere with its growing effect, or None if too small"""
+        current_radius = viewport.length(self.radius)
+        if self.radius <= 0 or current_radius <= 0:
+            return None
+        # Add a subtle glow effect during growth
+        if self.is_growing and (quality is None or quality['glow']):
+            effect = EFFECT_SPHERE_GLOW
+        elif (quality is not None and
+              current_radius < viewport.length(quality['outline_min_radius'])):
+            effect = EFFECT_DISC
+        else:
+            effect = EFFECT_SPHERE
+        x, y = viewport.point(self.x, self.y)
+        return sprites.blit_item(x, y, current_radius, self.color, effect)
+
+def record_trails(spheres, trails):
+    """Push every visible sphere's position into the shared trail buffer in one batch"""
+    visible = [sphere for sphere in spheres if sphere.radius > 0]
+    if visible:
+        trails.push_many([sphere.trail_slot for sphere in visible],
+                         [int(sphere.x) for sphere in visible],
+                         [int(sphere.y) for sphere in visible])
 
 class SphereDrawings:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, profile_log=None, output_size=None, image_path=None):
+        # Spheres and trails move in SCREEN_WIDTH x SCREEN_HEIGHT; the
+        # viewport scales them onto the window or export size
+        self.viewport = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT), output_size)
+        self.screen = pygame.display.set_mode(self.viewport.size)
         pygame.display.set_caption("Auto Sphere Art - Creating from center...")
         self.clock = pygame.time.Clock()
+        self.sim_clock = SimClock(SIM_RATE)  # Simulation advances on real time, not frames
         self.spheres = []
         self.running = True
         self.drawing_mode = True  # When True, trails persist
+        self.trail_mode = TRAIL_MODE
+        self.trails = TrailBuffer(TRAIL_LENGTH)  # Trail history of every sphere
+        self.trail_layer = pygame.Surface(self.viewport.size)  # Accumulated trails
+        self.resources = RenderResources()  # Fonts, fade surface and HUD text, built once
         self.dot_creator = ProgressiveDotCreator()  # Progressive dot creator
         self.physics_enabled = False  # Start with physics OFF for clean pattern
+        self.sprites = SpriteCache(scale=self.viewport.scale)  # Pre-rendered sphere sprites
+        self.dirty_rects = DirtyRectRenderer() if DIRTY_RECTS else None
+        self.profiler = FrameProfiler(profile_log)  # F3 toggles the timing overlay
+        self.quality = QualityGovernor(FRAME_BUDGET_MS, enabled=ADAPTIVE_QUALITY)
+        self.playhead = Playhead(SIM_RATE, self.viewport.size[0])  # Seek, scrub, reverse and speed
+        self.timeline = None  # Closed-form drawing, for jumping to any step
+        self.updates = 0  # Simulation steps run since creation started
         
-        # Load Artboard1 pattern
-        artboard_path = os.path.join("assets", "images", "Artboard1.png")
+        # Load the Artboard1 pattern (or --image)
+        artboard_path = image_path or os.path.join("assets", "images", "Artboard1.png")
+        image_name = os.path.basename(artboard_path)
         if os.path.exists(artboard_path):
             success = self.dot_creator.load_pattern(artboard_path)
             if success:
-                print("✅ Artboard1.png loaded for auto creation!")
+                print(f"✅ {image_name} loaded for auto creation!")
                 # AUTO START - No need to press G
                 self.start_progressive_creation(speed=3)
             else:
-                print("❌ Failed to load Artboard1 pattern")
+                print(f"❌ Failed to load {image_name} pattern")
         else:
-            print("❌ Artboard1.png not found in assets/images/")
+            print(f"❌ {artboard_path} not found")
         
         print("🎯 Auto-creating spheres from center to form your image!")
     
     def start_progressive_creation(self, speed=3):
         """Start progressive dot creation"""
         self.spheres.clear()
+        self.trails.clear()
+        self.trail_layer.fill(BLACK)
         self.dot_creator.start_creation(speed)
+        self.timeline = self.dot_creator.timeline()
+        self.playhead.reset(self.timeline.duration)
+        self.updates = 0
         self.physics_enabled = False
+        if self.dirty_rects:
+            self.dirty_rects.invalidate()
         print(f"🎬 One-by-one sphere creation started - speed {speed}")
         print("🎯 Watch each sphere appear individually!")
     
@@ -266,13 +385,20 @@ class SphereDrawings:
         velocity_x = random.uniform(-8, 8)
         velocity_y = random.uniform(-8, 8)
         
-        sphere = Sphere(x, y, radius, color, velocity_x, velocity_y)
+        sphere = Sphere(x, y, radius, color, velocity_x, velocity_y, self.trails)
         self.spheres.append(sphere)
         return sphere
     
+    def is_finished(self):
+        """True once every sphere has been created and its trail has settled"""
+        return (not self.dot_creator.is_creating() and
+                all(sphere.is_static() for sphere in self.spheres))
+    
     def handle_events(self):
         """Handle pygame events - minimal controls for auto mode"""
         for event in pygame.event.get():
+            self.profiler.handle_event(event)
+            self.playhead.handle_event(event)
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -283,40 +409,109 @@ class SphereDrawings:
                     self.spheres.clear()
                     self.start_progressive_creation(speed=3)
                     print("🔄 Restarting auto creation from center!")
+                elif event.key == pygame.K_t:
+                    # Switch between per-point and accumulated trails
+                    self.trail_mode = "accumulate" if self.trail_mode == "classic" else "classic"
+                    self.trail_layer.fill(BLACK)
+                    for sphere in self.spheres:
+                        sphere.last_trail_point = None
+                    print(f"🌠 Trail mode: {self.trail_mode}")
+                elif event.key == pygame.K_d:
+                    # Toggle persistent (fading) trails; without them every
+                    # frame starts clean, which lets dirty rects present it
+                    self.drawing_mode = not self.drawing_mode
+                    self.screen.fill(BLACK)
+                    if self.dirty_rects:
+                        self.dirty_rects.invalidate()
+                    print(f"🖌️ Persistent trails {'on' if self.drawing_mode else 'off'}")
     
     def update(self):
         """Update all spheres and handle progressive dot creation"""
         # Handle progressive dot creation
         new_dots = self.dot_creator.get_next_dots()
-        for dot_data in new_dots:
-            sphere = Sphere(
-                dot_data['x'], dot_data['y'], dot_data['radius'], dot_data['color'], 0, 0
-            )
-            # Set spawn delay for staggered appearance
-            sphere.spawn_delay = dot_data.get('spawn_delay', 0)
+        for x, y, color, radius in zip(new_dots['x'].tolist(), new_dots['y'].tolist(),
+                                       new_dots['color'].tolist(), new_dots['radius'].tolist()):
+            # No spawn delay - each sphere appears immediately
+            sphere = Sphere(x, y, radius, tuple(color), 0, 0, self.trails)
             self.spheres.append(sphere)
+        self.profiler.mark('spawn')
         
         # Update all spheres (including growth animation)
         for sphere in self.spheres:
             sphere.update()
+        record_trails(self.spheres, self.trails)
+        self.updates += 1
+        self.profiler.mark('update')
+    
+    def seek(self, position):
+        """Show the drawing at a step straight from the timeline"""
+        updates = int(position) + 1
+        state = self.timeline.state(updates)
+        count = len(state['x'])
+        jumped = abs(updates - self.updates) > 1
+        self.dot_creator.seek(updates, count)
+        self.updates = updates
+        
+        # Keep the sphere objects still alive and create only the missing ones
+        del self.spheres[count:]
+        self.trails.truncate(len(self.spheres))
+        for x, y, radius, color in zip(state['target_x'][len(self.spheres):].tolist(),
+                                       state['target_y'][len(self.spheres):].tolist(),
+                                       state['target_radius'][len(self.spheres):].tolist(),
+                                       state['color'][len(self.spheres):].tolist()):
+            self.spheres.append(Sphere(int(x), int(y), int(radius), tuple(color), 0, 0, self.trails))
+        self.trails.load(*self.timeline.trails(updates, TRAIL_LENGTH, count))
+        
+        for sphere, x, y, radius, velocity_x, velocity_y, growing, moving in zip(
+                self.spheres, state['x'].tolist(), state['y'].tolist(), state['radius'].tolist(),
+                state['velocity_x'].tolist(), state['velocity_y'].tolist(),
+                state['is_growing'].tolist(), state['is_moving_to_target'].tolist()):
+            sphere.x, sphere.y, sphere.radius = x, y, radius
+            sphere.velocity_x, sphere.velocity_y = velocity_x, velocity_y
+            sphere.is_growing, sphere.is_moving_to_target = growing, moving
+        
+        if jumped:
+            # Trails painted before a jump belong to another moment
+            self.screen.fill(BLACK)
+            self.trail_layer.fill(BLACK)
+            for sphere in self.spheres:
+                sphere.last_trail_point = None
+            if self.dirty_rects:
+                self.dirty_rects.invalidate()
+        self.profiler.mark('update')
     
     def draw(self):
         """Draw everything to the screen"""
-        if not self.drawing_mode:
+        quality = self.quality.settings
+        accumulate = self.trail_mode == "accumulate"
+        if accumulate:
+            # Fade the trail layer in place and add only each trail's newest
+            # segment - one draw per sphere instead of one per trail point
+            fade = int(255 * TRAIL_FADE ** (1 / quality['trail_scale']))
+            self.trail_layer.fill((fade, fade, fade), special_flags=pygame.BLEND_RGB_MULT)
+            for sphere in self.spheres:
+                sphere.draw_trail_segment(self.trail_layer, self.viewport)
+            self.screen.blit(self.trail_layer, (0, 0))
+        elif not self.drawing_mode:
             self.screen.fill(BLACK)
         else:
             # Create fade effect for persistent trails
-            fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            fade_surface.set_alpha(10)
-            fade_surface.fill(BLACK)
+            fade_surface = self.resources.fill_surface(self.viewport.size, BLACK, 10)
             self.screen.blit(fade_surface, (0, 0))
         
-        # Draw all spheres
+        # Draw every trail, then all spheres on top as one batch of
+        # pre-rendered sprites
+        if not accumulate:
+            for sphere in self.spheres:
+                sphere.draw_trail(self.screen, quality, self.viewport)
+        items = []
         for sphere in self.spheres:
-            sphere.draw(self.screen)
+            item = sphere.blit_item(self.sprites, quality, self.viewport)
+            if item is not None:
+                items.append(item)
+        self.screen.blits(items, doreturn=False)
         
-        # Draw instructions
-        font = pygame.font.Font(None, 16)
+        # Draw instructions - each line re-renders only when its text changes
         instructions = [
             "� ONE-BY-ONE SPHERE CREATION:",
             "G: Start Individual Sphere Creation",
@@ -324,33 +519,93 @@ class SphereDrawings:
             "+/-: Adjust delay between spheres",
             "",
             "⚙️ CONTROLS:",
-            "P: Toggle Physics | SPACE: Toggle Trails",
+            "P: Toggle Physics | SPACE: Restart | D: Toggle Trails | T: Trail Mode",
+            "Left/Right: Seek | Drag: Scrub | R: Reverse | [ ]: Speed | Home/End",
             "C: Clear | ESC: Exit",
             "",
             f"Status: {'Creating ONE BY ONE' if self.dot_creator.is_creating() else 'Ready'}",
             f"Spheres: {len(self.spheres)} | Remaining: {self.dot_creator.remaining_count()}"
         ]
         
+        scale = self.viewport.scale  # Text keeps its size relative to the output
+        text_rects = []
         for i, instruction in enumerate(instructions):
-            text = font.render(instruction, True, WHITE)
-            self.screen.blit(text, (10, 10 + i * 25))
+            text = self.resources.label(i, instruction, round(16 * scale), WHITE)
+            text_rects.append(self.screen.blit(text, (round(10 * scale), round((10 + i * 25) * scale))))
+        text_rects.append(self.profiler.draw_overlay(self.screen))
+        self.profiler.mark('draw')
         
-        pygame.display.flip()
+        # The trail fade touches every pixel, so only the clean mode can
+        # present partial updates
+        if self.dirty_rects and not self.drawing_mode and not accumulate:
+            rects = [sphere.bounds(self.viewport) for sphere in self.spheres
+                     if sphere.radius > 0 and not sphere.is_static()]
+            self.dirty_rects.present(rects + text_rects)
+        else:
+            pygame.display.flip()
+            if self.dirty_rects:
+                self.dirty_rects.invalidate()
+        self.profiler.mark('present')
+    
+    def profile_counts(self):
+        """Sphere counts reported to the frame profiler"""
+        growing = sum(1 for sphere in self.spheres if sphere.is_growing)
+        moving = sum(1 for sphere in self.spheres if sphere.is_moving_to_target)
+        return {
+            'alive': len(self.spheres),
+            'growing': growing,
+            'moving': moving,
+            'settled': len(self.spheres) - growing - moving,
+            'allocations': self.resources.frame_allocations() + self.sprites.frame_allocations(),
+            'quality': self.quality.level,
+        }
     
     def run(self):
         """Main game loop"""
         while self.running:
+            self.profiler.begin_frame()
             self.handle_events()
-            self.update()
+            self.profiler.mark('events')
+            # Seeks, scrubbing, reverse and other speeds jump straight to
+            # the playhead instead of stepping the simulation
+            steps = self.sim_clock.tick()
+            alpha = self.sim_clock.alpha
+            position = self.playhead.advance(steps, alpha) if self.timeline else None
+            if position is None:
+                for _ in range(steps):
+                    self.update()
+                self.playhead.sync(self.updates, alpha)
+            else:
+                self.seek(position)
             self.draw()
+            self.profiler.end_frame(**self.profile_counts())
+            if self.quality.record(self.profiler.last_work) and self.profiler.show_overlay:
+                print(f"⚙️ Quality level {self.quality.label}")
             self.clock.tick(FPS)
         
+        self.profiler.close()
         pygame.quit()
         sys.exit()
 
 def main():
     """Main function to run the sphere drawings application"""
-    app = SphereDrawings()
+    parser = argparse.ArgumentParser(description="Sphere Drawings")
+    parser.add_argument("--image", metavar="PATH",
+                        help="image to draw (default: assets/images/Artboard1.png)")
+    add_export_arguments(parser)
+    add_profiler_arguments(parser)
+    args = parser.parse_args()
+    size = output_size(parser, args, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    if is_export(args):
+        # Headless offline render - no window, no frame limiter
+        exporter = prepare_export(args)
+        app = SphereDrawings(output_size=size, image_path=args.image)
+        export_frames(app, exporter, args.frames)
+        pygame.quit()
+        return
+    
+    app = SphereDrawings(profile_log=args.profile_log, output_size=size, image_path=args.image)
     app.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,227 @@
+"""
+Sphere Store - Structure-of-arrays storage for animated spheres
+Keeps positions, targets, radii, colors and growth/move state in NumPy arrays
+and advances every active sphere in one batched step.
+"""
+
+import numpy as np
+
+# Float fields stored one array per property
+FLOAT_FIELDS = (
+    'x', 'y', 'target_x', 'target_y', 'radius', 'target_radius',
+    'velocity_x', 'velocity_y', 'growth_speed', 'move_speed',
+    'prev_x', 'prev_y', 'prev_radius',  # State before the last update, for interpolation
+)
+
+# Distance at which a moving sphere snaps onto its target
+ARRIVAL_DISTANCE = 2
+
+
+class SphereStore:
+    """Array-backed sphere storage with a batched grow / move-to-target step"""
+
+    def __init__(self, capacity=1024):
+        self.count = 0
+        self._capacity = 0
+        self._allocate(max(1, capacity))
+        self.active = np.empty(0, dtype=np.intp)  # Indices still animating
+        self._merged = 0  # Rows from here to count were added since the last update
+
+    def _allocate(self, capacity):
+        """Grow every array to the given capacity, keeping existing rows"""
+        def grow(old, shape, dtype):
+            new = np.zeros(shape, dtype=dtype)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            return new
+
+        for name in FLOAT_FIELDS:
+            setattr(self, name, grow(getattr(self, name, None), capacity, np.float64))
+        self.color = grow(getattr(self, 'color', None), (capacity, 3), np.uint8)
+        self.spawn_delay = grow(getattr(self, 'spawn_delay', None), capacity, np.int32)
+        self.is_growing = grow(getattr(self, 'is_growing', None), capacity, bool)
+        self.is_moving_to_target = grow(getattr(self, 'is_moving_to_target', None), capacity, bool)
+        self._capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def add(self, target_x, target_y, radius, color, start_x, start_y,
+            growth_speed, move_speed, spawn_delay=0):
+        """Add a sphere that starts invisible at (start_x, start_y); returns its index"""
+        if self.count == self._capacity:
+            self._allocate(self._capacity * 2)
+
+        i = self.count
+        self.x[i] = self.prev_x[i] = start_x
+        self.y[i] = self.prev_y[i] = start_y
+        self.prev_radius[i] = 0
+        self.target_x[i] = target_x
+        self.target_y[i] = target_y
+        self.radius[i] = 0  # Start with 0 radius (invisible)
+        self.target_radius[i] = radius
+        self.velocity_x[i] = 0
+        self.velocity_y[i] = 0
+        self.growth_speed[i] = growth_speed
+        self.move_speed[i] = move_speed
+        self.color[i] = color
+        self.spawn_delay[i] = spawn_delay
+        self.is_growing[i] = True
+        self.is_moving_to_target[i] = False
+
+        self.count += 1
+        return i
+
+    def add_many(self, target_x, target_y, radius, color, start_x, start_y,
+                 growth_speed, move_speed, spawn_delay=0):
+        """Add a batch of spheres from arrays; returns their index range"""
+        n = len(target_x)
+        if self.count + n > self._capacity:
+            self._allocate(max(self._capacity * 2, self.count + n))
+
+        rows = slice(self.count, self.count + n)
+        self.x[rows] = self.prev_x[rows] = start_x
+        self.y[rows] = self.prev_y[rows] = start_y
+        self.prev_radius[rows] = 0
+        self.target_x[rows] = target_x
+        self.target_y[rows] = target_y
+        self.radius[rows] = 0
+        self.target_radius[rows] = radius
+        self.velocity_x[rows] = 0
+        self.velocity_y[rows] = 0
+        self.growth_speed[rows] = growth_speed
+        self.move_speed[rows] = move_speed
+        self.color[rows] = color
+        self.spawn_delay[rows] = spawn_delay
+        self.is_growing[rows] = True
+        self.is_moving_to_target[rows] = False
+
+        self.count += n
+        return range(rows.start, rows.stop)
+
+    def load(self, state, prev=None):
+        """Replace every sphere with field arrays such as a Timeline state
+
+        prev holds the x/y/radius of the step before, for interpolation.
+        """
+        n = len(state['x'])
+        if n > self._capacity:
+            self._allocate(max(self._capacity * 2, n))
+        self.count = n
+        for name, values in state.items():
+            getattr(self, name)[:n] = values
+        prev = prev if prev is not None else state
+        self.prev_x[:n] = prev['x']
+        self.prev_y[:n] = prev['y']
+        self.prev_radius[:n] = prev['radius']
+        self.active = np.flatnonzero(self.is_growing[:n] | self.is_moving_to_target[:n] |
+                                     (self.spawn_delay[:n] > 0))
+        self._merged = n
+
+    def clear(self):
+        """Remove all spheres"""
+        self.count = 0
+        self.active = np.empty(0, dtype=np.intp)
+        self._merged = 0
+
+    def update(self):
+        """Advance all active spheres one frame; returns indices that settled"""
+        if self._merged < self.count:
+            added = np.arange(self._merged, self.count, dtype=np.intp)
+            self.active = np.concatenate((self.active, added))
+            self._merged = self.count
+        if len(self.active) == 0:
+            return self.active
+
+        active = self.active
+        self.prev_x[active] = self.x[active]
+        self.prev_y[active] = self.y[active]
+        self.prev_radius[active] = self.radius[active]
+        settled = self.step(active)
+
+        # Settled spheres never change again - keep them out of per-frame work
+        settled_indices = self.active[settled]
+        self.active = self.active[~settled]
+        return settled_indices
+
+    def interpolated(self, idx, alpha):
+        """(x, y, radius) at idx blended alpha of the way from the previous update"""
+        x, y, radius = self.x[idx], self.y[idx], self.radius[idx]
+        if alpha >= 1:
+            return x, y, radius
+        prev_x, prev_y, prev_radius = self.prev_x[idx], self.prev_y[idx], self.prev_radius[idx]
+        return (prev_x + (x - prev_x) * alpha, prev_y + (y - prev_y) * alpha,
+                prev_radius + (radius - prev_radius) * alpha)
+
+    def step(self, idx):
+        """Advance the spheres at idx one frame; returns a mask of settled ones"""
+        radius = self.radius[idx]
+        target_radius = self.target_radius[idx]
+        is_growing = self.is_growing[idx]
+        is_moving = self.is_moving_to_target[idx]
+        spawn_delay = self.spawn_delay[idx]
+
+        # Handle sphere growth animation (appearing effect)
+        growing_now = is_growing & (spawn_delay <= 0) & (radius < target_radius)
+        radius = np.where(growing_now, radius + self.growth_speed[idx], radius)
+        finished = growing_now & (radius >= target_radius)
+        radius = np.where(finished, target_radius, radius)
+        is_growing = is_growing & ~finished
+        is_moving = is_moving | finished  # Start moving to target after growing
+        spawn_delay = np.where(spawn_delay > 0, spawn_delay - 1, spawn_delay)
+
+        # Move towards target position after growing
+        x = self.x[idx]
+        y = self.y[idx]
+        velocity_x = self.velocity_x[idx]
+        velocity_y = self.velocity_y[idx]
+        target_x = self.target_x[idx]
+        target_y = self.target_y[idx]
+
+        moving = is_moving & ~is_growing
+        dx = target_x - x
+        dy = target_y - y
+        distance = np.sqrt(dx*dx + dy*dy)
+
+        still_moving = moving & (distance > ARRIVAL_DISTANCE)
+        arrived = moving & ~still_moving
+        move_speed = self.move_speed[idx]
+        velocity_x = np.where(still_moving, dx * move_speed, np.where(arrived, 0.0, velocity_x))
+        velocity_y = np.where(still_moving, dy * move_speed, np.where(arrived, 0.0, velocity_y))
+        x = np.where(arrived, target_x, x)
+        y = np.where(arrived, target_y, y)
+        is_moving = is_moving & ~arrived
+
+        # Update position
+        self.x[idx] = x + velocity_x
+        self.y[idx] = y + velocity_y
+        self.radius[idx] = radius
+        self.velocity_x[idx] = velocity_x
+        self.velocity_y[idx] = velocity_y
+        self.is_growing[idx] = is_growing
+        self.is_moving_to_target[idx] = is_moving
+        self.spawn_delay[idx] = spawn_delay
+
+        return (~is_growing & ~is_moving & (spawn_delay <= 0) &
+                (velocity_x == 0) & (velocity_y == 0))
+
+
+class SphereField:
+    """Descriptor exposing one SphereStore array as a scalar attribute of a view"""
+
+    def __init__(self, name, convert=float):
+        self.name = name
+        self.convert = convert
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return self.convert(getattr(view.store, self.name)[view.index])
+
+    def __set__(self, view, value):
+        getattr(view.store, self.name)[view.index] = value
+
+
+def color_tuple(value):
+    """Convert a stored color row to an (r, g, b) tuple"""
+    return tuple(int(c) for c in value)
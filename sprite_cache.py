@@ -0,0 +1,152 @@
+"""
+Sprite Cache - Pre-rendered circle sprites for batched drawing
+Each shaded circle, outline and glow is rasterized once with pygame.draw into a
+transparent surface, kept in an LRU cache keyed by (radius, color, effect), and
+then drawn with Surface.blits batches instead of per-frame draw calls. A cache
+made for a scaled output draws outlines and glow rings at that scale and caps
+gradient rings, so large sprites stay cheap to rasterize.
+"""
+
+import math
+from collections import OrderedDict
+
+import pygame
+
+WHITE = (255, 255, 255)
+OUTLINE_WIDTH = 2
+GLOW_GAP = 3  # Distance from the sphere edge to its glow ring
+GLOW_WIDTH = 2
+GRADIENT_STEPS = 48  # Most concentric rings in a shaded sprite
+MAX_SPRITE_BYTES = 256 * 1024 * 1024  # Pixel memory the cache may hold
+
+# Effects understood by SpriteCache.get; parameterized effects are tuples
+EFFECT_DISC = 'disc'                # Flat filled circle
+EFFECT_SPHERE = 'sphere'            # Filled circle with white outline
+EFFECT_SPHERE_GLOW = 'sphere_glow'  # Sphere with the growth glow ring around it
+EFFECT_SHADED = 'shaded'            # Concentric gradient with white outline
+EFFECT_RING = 'ring'                # ('ring', width) - circle outline only
+
+
+def _line(width, scale):
+    """A line width drawn at an output scale, never thinner than one pixel"""
+    return max(1, round(width * scale))
+
+
+def _draw_disc(surface, center, radius, color, scale=1):
+    pygame.draw.circle(surface, color, center, radius)
+
+
+def _draw_sphere(surface, center, radius, color, scale=1):
+    pygame.draw.circle(surface, color, center, radius)
+    pygame.draw.circle(surface, WHITE, center, radius, _line(OUTLINE_WIDTH, scale))
+
+
+def _draw_sphere_glow(surface, center, radius, color, scale=1):
+    # Outer glow - ensure color values don't exceed 255
+    glow_color = tuple(min(255, int(c) + 50) for c in color)
+    pygame.draw.circle(surface, glow_color, center, radius + round(GLOW_GAP * scale),
+                       _line(GLOW_WIDTH, scale))
+    _draw_sphere(surface, center, radius, color, scale)
+
+
+def _draw_shaded(surface, center, radius, color, scale=1):
+    # Draw multiple concentric circles for gradient effect; big sprites
+    # step through at most GRADIENT_STEPS rings
+    step = max(1, math.ceil(radius / GRADIENT_STEPS))
+    for i in range(radius, 0, -step):
+        intensity = i / radius
+        shaded_color = tuple(int(c * (0.4 + 0.6 * intensity)) for c in color)
+        pygame.draw.circle(surface, shaded_color, center, i)
+    pygame.draw.circle(surface, WHITE, center, radius, _line(OUTLINE_WIDTH, scale))
+
+
+def _draw_ring(surface, center, radius, color, width, scale=1):
+    pygame.draw.circle(surface, color, center, radius, _line(width, scale))
+
+
+# effect name -> (rasterizer, extra layout pixels the effect reaches beyond radius)
+EFFECTS = {
+    EFFECT_DISC: (_draw_disc, 0),
+    EFFECT_SPHERE: (_draw_sphere, 0),
+    EFFECT_SPHERE_GLOW: (_draw_sphere_glow, GLOW_GAP),
+    EFFECT_SHADED: (_draw_shaded, 0),
+    EFFECT_RING: (_draw_ring, 0),
+}
+
+
+class SpriteCache:
+    """LRU cache of rasterized circle sprites keyed by (radius, color, effect)"""
+
+    def __init__(self, max_sprites=8192, scale=1.0, max_bytes=MAX_SPRITE_BYTES):
+        self.max_sprites = max_sprites
+        self.max_bytes = max_bytes
+        self.scale = scale  # Output scale that outline and glow widths follow
+        self.sprites = OrderedDict()
+        self.bytes = 0  # Pixel memory held by cached sprites
+        self.allocations = 0  # Sprites rasterized in total
+        self._frame_start = 0
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def clear(self):
+        self.sprites.clear()
+        self.bytes = 0
+
+    def frame_allocations(self):
+        """Sprites rasterized since the last call - zero once a scene's sprites are cached"""
+        count = self.allocations - self._frame_start
+        self._frame_start = self.allocations
+        return count
+
+    def get(self, radius, color, effect=EFFECT_SPHERE):
+        """Return (surface, offset) - blit the surface at (x - offset, y - offset)"""
+        key = (radius, color, effect)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite
+
+        sprite = self._rasterize(radius, color, effect)
+        self.allocations += 1
+        self.sprites[key] = sprite
+        self.bytes += self._size(sprite)
+        # Evict the least recently used - high-resolution sprites hit the
+        # byte budget long before the count limit
+        while len(self.sprites) > self.max_sprites or (
+                self.bytes > self.max_bytes and len(self.sprites) > 1):
+            self.bytes -= self._size(self.sprites.popitem(last=False)[1])
+        return sprite
+
+    def blit_item(self, x, y, radius, color, effect=EFFECT_SPHERE):
+        """(surface, position) pair for Surface.blits, centred on (x, y)"""
+        surface, offset = self.get(radius, color, effect)
+        return surface, (x - offset, y - offset)
+
+    def _rasterize(self, radius, color, effect):
+        """Draw one sprite with the same pygame.draw calls as direct rendering"""
+        if isinstance(effect, tuple):
+            name, params = effect[0], effect[1:]
+        else:
+            name, params = effect, ()
+        draw, margin = EFFECTS[name]
+
+        # One spare pixel on each side covers pygame's circle rasterization
+        offset = radius + round(margin * self.scale) + 1
+        size = 2 * offset + 1
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        draw(surface, (offset, offset), radius, color, *params, scale=self.scale)
+
+        # Match the display format for fast blits when a window exists
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface, offset
+
+    @staticmethod
+    def _size(sprite):
+        surface = sprite[0]
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# Shared cache for code that draws without owning one
+default_cache = SpriteCache()
@@ -0,0 +1,35 @@
+"""
+Static Layer - Persistent background for drawables that stopped changing
+Items that have settled are composited once into an offscreen surface; each
+frame then blits that surface and draws only what is still animating.
+"""
+
+import pygame
+
+BLACK = (0, 0, 0)
+
+
+class StaticLayer:
+    """Offscreen surface that accumulates baked sprites"""
+
+    def __init__(self, size, background=BLACK):
+        self.background = background
+        self.surface = pygame.Surface(size)
+        self.clear()
+
+    def clear(self):
+        """Drop everything baked so far"""
+        self.surface.fill(self.background)
+
+    def bake(self, items, doreturn=False):
+        """Composite a list of (surface, position) blits into the layer for good
+
+        Returns the baked rects when doreturn is set.
+        """
+        if items:
+            return self.surface.blits(items, doreturn=doreturn)
+        return [] if doreturn else None
+
+    def draw(self, screen):
+        """Blit the baked layer, replacing the usual clear of the screen"""
+        screen.blit(self.surface, (0, 0))
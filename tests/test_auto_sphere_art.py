@@ -0,0 +1,62 @@
+"""
+Auto Sphere Art - Headless checks of what dirty-rect presenting leaves on screen
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Headless: must be set before pygame creates the display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+import pytest
+
+import auto_sphere_art
+from dirty_rects import DirtyRectRenderer
+
+
+@pytest.fixture
+def app(monkeypatch, request):
+    """Seeded app presenting through dirty rects, with the layout cache off"""
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(auto_sphere_art, "LAYOUT_CACHE", False)
+    image = getattr(request, "param", None)
+    pygame.init()
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = auto_sphere_art.AutoSphereArt(seed=0, image_path=image)
+    app.dirty_rects = DirtyRectRenderer()
+    app.draw()
+    yield app
+    app.profiler.close()
+    pygame.quit()
+
+
+def differing_pixels(a, b):
+    return int((pygame.surfarray.array3d(a) != pygame.surfarray.array3d(b)).any(axis=2).sum())
+
+
+def test_forward_seek_presents_baked_spheres(app):
+    """A scrub forward and a jump to the end show the whole settled formation"""
+    for _ in range(200):
+        app.update()
+        app.draw()
+    for _ in range(20):
+        app.draw(app.seek(app.updates + 7.5))
+    app.seek(app.timeline.duration)
+    app.draw()
+    assert differing_pixels(app.screen, app.static_layer.surface) == 0
+
+
+@pytest.mark.parametrize("app", [os.path.join("assets", "images", "smiley.png")], indirect=True)
+def test_settling_between_steps_leaves_no_fringe(app):
+    """Spheres drawn at an interpolated position are repainted where they bake"""
+    while not app.is_finished():
+        app.update()
+        app.draw(0.1)
+    assert differing_pixels(app.screen, app.static_layer.surface) == 0
@@ -0,0 +1,215 @@
+"""
+Timeline - Closed-form sphere animation for random-access playback
+A sphere's motion is a linear radius ramp followed by an exponential approach
+to its target, so its state after any number of simulation steps follows
+directly from its spawn step. The timeline evaluates a whole formation at any
+step in one vectorized pass, which lets the apps seek, scrub, reverse and
+change speed without replaying earlier frames.
+"""
+
+import numpy as np
+import pygame
+
+from sphere_store import ARRIVAL_DISTANCE
+
+SEEK_SECONDS = 2  # Jump made by the arrow keys
+SPEEDS = (0.25, 0.5, 1, 2, 4, 8, 16)  # Playback speed multipliers
+
+
+class Timeline:
+    """Spawn schedule and motion parameters of a formation, evaluable at any step"""
+
+    def __init__(self, target_x, target_y, radius, color, start_x, start_y,
+                 growth_speed, move_speed, creation_delay=1, per_step=1):
+        self.target_x = np.asarray(target_x, dtype=np.float64)
+        self.target_y = np.asarray(target_y, dtype=np.float64)
+        self.target_radius = np.asarray(radius, dtype=np.float64)
+        self.color = np.asarray(color, dtype=np.uint8).reshape(-1, 3)
+        self.start_x = float(start_x)
+        self.start_y = float(start_y)
+        self.growth_speed = float(growth_speed)
+        self.move_speed = float(move_speed)
+        n = len(self.target_x)
+
+        # The creator hands out per_step dots every creation_delay updates;
+        # a sphere takes its first step in the update that spawns it
+        self.spawn_step = (np.arange(n) // per_step + 1) * creation_delay - 1
+
+        # Growth ends (and movement starts) on the step the radius reaches its target
+        self.grow_steps = np.maximum(1, np.ceil(self.target_radius / self.growth_speed)).astype(np.int64)
+
+        # Each move step shrinks the distance to the target by (1 - move_speed);
+        # the sphere snaps on the first step that finds it within ARRIVAL_DISTANCE
+        self.offset_x = self.target_x - self.start_x
+        self.offset_y = self.target_y - self.start_y
+        distance = np.hypot(self.offset_x, self.offset_y)
+        with np.errstate(divide='ignore'):
+            moves = np.log(ARRIVAL_DISTANCE / distance) / np.log(1 - self.move_speed)
+        self.move_steps = np.where(distance > ARRIVAL_DISTANCE, np.ceil(moves), 0).astype(np.int64)
+
+        # Updates after which each sphere has settled, and the order they settle in
+        self.settle_updates = self.spawn_step + self.grow_steps + self.move_steps
+        self.settle_order = np.lexsort((np.arange(n), self.settle_updates))
+        self._settle_sorted = self.settle_updates[self.settle_order]
+
+    def __len__(self):
+        return len(self.target_x)
+
+    @property
+    def duration(self):
+        """Updates until every sphere has settled"""
+        return int(self.settle_updates.max()) if len(self) else 0
+
+    def spawned(self, updates):
+        """Number of spheres created after the given number of updates"""
+        return int(np.searchsorted(self.spawn_step, updates))
+
+    def settled_between(self, after, through):
+        """Indices settling after update `after` up to `through`, in bake order"""
+        lo, hi = np.searchsorted(self._settle_sorted, (after, through), side='right')
+        return self.settle_order[lo:hi]
+
+    def state(self, updates, count=None):
+        """Every field of the first count spheres (default: those spawned) after updates"""
+        if count is None:
+            count = self.spawned(updates)
+        rows = slice(0, count)
+        steps = updates - self.spawn_step[rows]
+        x, y, radius, velocity_x, velocity_y, is_growing, is_moving = self._evaluate(steps, rows)
+        return {
+            'x': x, 'y': y, 'radius': radius,
+            'target_x': self.target_x[rows], 'target_y': self.target_y[rows],
+            'target_radius': self.target_radius[rows], 'color': self.color[rows],
+            'velocity_x': velocity_x, 'velocity_y': velocity_y,
+            'growth_speed': self.growth_speed, 'move_speed': self.move_speed, 'spawn_delay': 0,
+            'is_growing': is_growing, 'is_moving_to_target': is_moving,
+        }
+
+    def trails(self, updates, length, count=None):
+        """(count, length, 2) integer trail positions, oldest first, and valid lengths"""
+        if count is None:
+            count = self.spawned(updates)
+        rows = slice(0, count)
+        steps = updates - self.spawn_step[rows]
+        # Positions after each of the last `length` steps; a trail point is
+        # recorded on every step from the first, once the sphere has a radius
+        grid = steps[:, None] - np.arange(length - 1, -1, -1)[None, :]
+        x, y = self._evaluate(grid, rows)[:2]
+        sizes = np.clip(steps, 0, length)
+        # Left-align short trails so the valid points come first
+        columns = np.minimum(np.arange(length)[None, :] + (length - sizes)[:, None], length - 1)
+        positions = np.stack((np.take_along_axis(x, columns, axis=1),
+                              np.take_along_axis(y, columns, axis=1)), axis=-1)
+        return positions.astype(np.int32), sizes
+
+    def _evaluate(self, steps, rows):
+        """Position, radius, velocity and flags after the given steps (any shape)"""
+        def param(values):
+            values = values[rows]
+            return values if steps.ndim == 1 else values[:, None]
+
+        target_x, target_y = param(self.target_x), param(self.target_y)
+        offset_x, offset_y = param(self.offset_x), param(self.offset_y)
+        target_radius = param(self.target_radius)
+        grow_steps, move_steps = param(self.grow_steps), param(self.move_steps)
+        steps = np.maximum(steps, 0)
+
+        is_growing = steps < grow_steps
+        radius = np.where(is_growing, steps * self.growth_speed, target_radius)
+
+        # Move steps taken so far (the first one shares the step growth ends on)
+        moves = np.where(is_growing, 0, steps - grow_steps + 1)
+        is_moving = ~is_growing & (moves <= move_steps)
+        remaining = (1 - self.move_speed) ** moves  # Share of the offset still to cover
+        x = np.where(is_growing, self.start_x, np.where(is_moving, target_x - offset_x * remaining, target_x))
+        y = np.where(is_growing, self.start_y, np.where(is_moving, target_y - offset_y * remaining, target_y))
+
+        # Velocity of the last move step: the offset left before it times move_speed
+        pull = np.where(is_moving, remaining / (1 - self.move_speed) * self.move_speed, 0.0)
+        return x, y, radius, offset_x * pull, offset_y * pull, is_growing, is_moving
+
+
+class Playhead:
+    """Seek, scrub, reverse and speed controls over a timeline measured in steps"""
+
+    def __init__(self, step_rate, width):
+        self.step_rate = step_rate
+        self.width = width  # Dragging across the window scrubs the whole timeline
+        self.position = 0.0
+        self.duration = 0
+        self.speed_index = SPEEDS.index(1)
+        self.reverse = False
+        self.scrubbing = False
+        self._jumped = False
+        self._alpha = 0.0
+
+    @property
+    def speed(self):
+        return SPEEDS[self.speed_index]
+
+    @property
+    def live(self):
+        """True while playback is plain forward play the simulation can step itself"""
+        return self.speed == 1 and not self.reverse and not self.scrubbing
+
+    def reset(self, duration):
+        """Start over on a (new) timeline of the given duration in updates"""
+        self.duration = duration
+        self.position = 0.0
+        self.reverse = False
+        self.scrubbing = False
+        self.speed_index = SPEEDS.index(1)
+        self._jumped = False
+        self._alpha = 0.0
+
+    def handle_event(self, event):
+        """Apply a timeline key or scrub drag; returns True if the event was used"""
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                direction = -1 if event.key == pygame.K_LEFT else 1
+                self._jump(self.position + direction * SEEK_SECONDS * self.step_rate)
+            elif event.key == pygame.K_HOME:
+                self._jump(0)
+            elif event.key == pygame.K_END:
+                self._jump(self.duration)
+            elif event.key == pygame.K_r:
+                self.reverse = not self.reverse
+                print(f"⏯️ Playback {'reversed' if self.reverse else 'forward'}")
+            elif event.key in (pygame.K_LEFTBRACKET, pygame.K_RIGHTBRACKET):
+                change = -1 if event.key == pygame.K_LEFTBRACKET else 1
+                self.speed_index = min(max(self.speed_index + change, 0), len(SPEEDS) - 1)
+                print(f"⏩ Playback speed {self.speed}x")
+            else:
+                return False
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.scrubbing = True
+            self._jump(event.pos[0] / self.width * self.duration)
+            return True
+        if event.type == pygame.MOUSEMOTION and self.scrubbing:
+            self._jump(event.pos[0] / self.width * self.duration)
+            return True
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.scrubbing:
+            self.scrubbing = False
+            return True
+        return False
+
+    def advance(self, steps, alpha):
+        """Position to show after a tick of the sim clock, or None to step live"""
+        elapsed = steps + alpha - self._alpha
+        self._alpha = alpha
+        if self.live and not self._jumped:
+            return None
+        self._jumped = False
+        if not self.scrubbing:
+            direction = -1 if self.reverse else 1
+            self._jump(self.position + direction * self.speed * elapsed)
+        return self.position
+
+    def sync(self, updates, alpha):
+        """Follow live playback that has run the given number of updates"""
+        self.position = min(max(updates - 1 + alpha, 0.0), self.duration)
+
+    def _jump(self, position):
+        self.position = min(max(float(position), 0.0), self.duration)
+        self._jumped = True
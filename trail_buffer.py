@@ -0,0 +1,92 @@
+"""
+Trail Buffer - Shared ring buffer of recent sphere positions
+Every sphere owns one row of a preallocated NumPy array that holds its last
+max_length positions; writes overwrite the oldest entry in place instead of
+popping from the front of a list.
+"""
+
+import numpy as np
+
+
+class TrailBuffer:
+    """Fixed-length position history for many spheres in one array"""
+
+    def __init__(self, max_length=50, capacity=256):
+        self.max_length = max_length
+        self.count = 0  # Rows handed out
+        self.positions = np.zeros((capacity, max_length, 2), dtype=np.int32)
+        self.head = np.zeros(capacity, dtype=np.int32)  # Next row entry to overwrite
+        self.size = np.zeros(capacity, dtype=np.int32)  # Valid entries in the row
+
+    def allocate(self):
+        """Reserve an empty row for a new sphere; returns its slot"""
+        if self.count == len(self.positions):
+            capacity = 2 * len(self.positions)
+            positions = np.zeros((capacity, self.max_length, 2), dtype=np.int32)
+            positions[:self.count] = self.positions
+            self.positions = positions
+            self.head = np.resize(self.head, capacity)
+            self.size = np.resize(self.size, capacity)
+
+        slot = self.count
+        self.head[slot] = 0
+        self.size[slot] = 0
+        self.count += 1
+        return slot
+
+    def clear(self):
+        """Release every row"""
+        self.count = 0
+
+    def truncate(self, count):
+        """Release every row from count on"""
+        self.count = min(self.count, count)
+
+    def load(self, positions, sizes):
+        """Overwrite the allocated rows with (n, max_length, 2) oldest-first positions"""
+        n = self.count
+        self.positions[:n] = positions
+        self.size[:n] = sizes
+        self.head[:n] = np.asarray(sizes) % self.max_length
+
+    def push(self, slot, x, y):
+        """Append a position to a row, dropping its oldest once full"""
+        head = self.head[slot]
+        self.positions[slot, head] = (x, y)
+        self.head[slot] = (head + 1) % self.max_length
+        if self.size[slot] < self.max_length:
+            self.size[slot] += 1
+
+    def push_many(self, slots, xs, ys):
+        """Append one position to each of several distinct rows at once"""
+        slots = np.asarray(slots, dtype=np.intp)
+        heads = self.head[slots]
+        self.positions[slots, heads, 0] = xs
+        self.positions[slots, heads, 1] = ys
+        self.head[slots] = (heads + 1) % self.max_length
+        self.size[slots] = np.minimum(self.size[slots] + 1, self.max_length)
+
+    def __len__(self):
+        return self.count
+
+    def length(self, slot):
+        return int(self.size[slot])
+
+    def ordered(self, slot):
+        """The row's valid positions, oldest first, as an (n, 2) array"""
+        size = self.size[slot]
+        if size < self.max_length:
+            return self.positions[slot, :size]
+        order = (self.head[slot] + np.arange(self.max_length)) % self.max_length
+        return self.positions[slot, order]
+
+    def oldest(self, slot):
+        if self.size[slot] < self.max_length:
+            return tuple(self.positions[slot, 0].tolist())
+        return tuple(self.positions[slot, self.head[slot]].tolist())
+
+    def latest(self, slot, back=0):
+        """Position written back+1 pushes ago, or None if the row is shorter"""
+        if back >= self.size[slot]:
+            return None
+        return tuple(self.positions[slot, (self.head[slot] - 1 - back) % self.max_length].tolist())
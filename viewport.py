@@ -0,0 +1,68 @@
+"""
+Viewport - Maps layout coordinates onto an output surface of any size
+Layouts and the simulation live in a fixed layout space (each app's
+SCREEN_WIDTH x SCREEN_HEIGHT design canvas). A viewport scales that space
+uniformly onto the window or an offscreen render target and centres it, so one
+layout drives a 1080p preview and a 4K or 8K final render without being
+recomputed.
+"""
+
+import argparse
+
+# Named output resolutions accepted by --size
+OUTPUT_PRESETS = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "1440p": (2560, 1440),
+    "4k": (3840, 2160),
+    "8k": (7680, 4320),
+}
+MAX_OUTPUT_SIZE = (7680, 4320)  # 8K - offscreen renders may not exceed it
+
+
+def parse_size(text):
+    """argparse type for --size: WIDTHxHEIGHT or one of OUTPUT_PRESETS"""
+    size = OUTPUT_PRESETS.get(text.lower())
+    if size is None:
+        try:
+            width, height = (int(part) for part in text.lower().split("x"))
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"expected WIDTHxHEIGHT or one of {', '.join(OUTPUT_PRESETS)}, got {text!r}")
+        size = (width, height)
+    if not (0 < size[0] <= MAX_OUTPUT_SIZE[0] and 0 < size[1] <= MAX_OUTPUT_SIZE[1]):
+        raise argparse.ArgumentTypeError(
+            f"output size must be within {MAX_OUTPUT_SIZE[0]}x{MAX_OUTPUT_SIZE[1]}, got {text!r}")
+    return size
+
+
+class Viewport:
+    """Uniform scale plus letterbox offset from layout space to output pixels"""
+
+    def __init__(self, layout_size, output_size=None):
+        self.layout_size = tuple(layout_size)
+        self.size = tuple(output_size) if output_size else self.layout_size
+        self.scale = min(self.size[0] / self.layout_size[0], self.size[1] / self.layout_size[1])
+        # Whole-pixel offsets keep every mapped point on the same grid
+        self.offset_x = (self.size[0] - round(self.layout_size[0] * self.scale)) // 2
+        self.offset_y = (self.size[1] - round(self.layout_size[1] * self.scale)) // 2
+
+    def point(self, x, y):
+        """Output pixel for a layout position"""
+        return int(x * self.scale + self.offset_x), int(y * self.scale + self.offset_y)
+
+    def points(self, xs, ys):
+        """Output pixels for arrays of layout positions"""
+        return ((xs * self.scale + self.offset_x).astype(int),
+                (ys * self.scale + self.offset_y).astype(int))
+
+    def length(self, value):
+        """Output pixels for a layout distance such as a radius"""
+        return int(value * self.scale)
+
+    def lengths(self, values):
+        return (values * self.scale).astype(int)
+
+
+# Layout space drawn 1:1 - the default for code that draws without a viewport
+IDENTITY = Viewport((1, 1))